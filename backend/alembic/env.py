@@ -3,9 +3,10 @@ from __future__ import annotations
 
 from logging.config import fileConfig
 from pathlib import Path
+from typing import Any
 
 from sqlalchemy import engine_from_config, pool
-from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy import create_engine
 
 from alembic import context
@@ -21,6 +22,8 @@ if config.config_file_name is not None:
 # Ensure project root on path
 root_path = Path(__file__).resolve().parents[1]
 sys.path.append(str(root_path))
+# Make migration_helpers importable from revision scripts
+sys.path.append(str(Path(__file__).resolve().parent))
 
 from src.infrastructure.adapters.models import Base
 
@@ -37,6 +40,31 @@ def get_url() -> str:
     return config.get_main_option("sqlalchemy.url")
 
 
+def is_sqlite(url: str) -> bool:
+    """SQLite needs batch mode (copy-and-move) for ALTER operations."""
+    return url.startswith("sqlite")
+
+
+def get_pool_options() -> dict[str, Any]:
+    """
+    Pool settings for the migration engine.
+
+    Reuses a bounded QueuePool so a multi-revision upgrade does not open a
+    fresh connection per step. Set ALEMBIC_POOL=null when running behind an
+    external pooler (pgbouncer, Supavisor); sizing kwargs are then omitted
+    because NullPool rejects them.
+    """
+    if os.getenv("ALEMBIC_POOL") == "null":
+        return {"poolclass": pool.NullPool}
+    return {
+        "poolclass": pool.QueuePool,
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
+
 def run_migrations_offline() -> None:
     url = get_url()
     context.configure(
@@ -44,30 +72,57 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         compare_type=True,
+        render_as_batch=is_sqlite(url),
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
         context.run_migrations()
 
 
-def run_migrations_online() -> None:
-    url = get_url()
-    connectable = engine_from_config(
+def get_engine(url: str) -> Engine:
+    """
+    Build the migration engine for one Alembic command.
+
+    The engine is bound to the given URL and must be disposed by the caller
+    once migrations have run, so no pooled connection outlives the command.
+    """
+    return engine_from_config(
         config.get_section(config.config_ini_section) or {},
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
         url=url,
+        **get_pool_options(),
+    )
+
+
+def do_run_migrations(connection: Connection, url: str) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        compare_type=True,
+        render_as_batch=is_sqlite(url),
+        transaction_per_migration=True,
     )
 
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-            compare_type=True,
-        )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    url = get_url()
 
-        with context.begin_transaction():
-            context.run_migrations()
+    # Reuse a caller-provided connection when given
+    connection: Connection | None = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection, url)
+        return
+
+    engine = get_engine(url)
+    try:
+        with engine.connect() as connection:
+            do_run_migrations(connection, url)
+    finally:
+        engine.dispose()
 
 
 if context.is_offline_mode():
@@ -0,0 +1,98 @@
+"""
+Helpers for data migrations.
+
+Backfills over conversations/messages must not load whole tables into a
+single transaction. These helpers page through rows and run writes in
+autocommit blocks so memory and lock time stay bounded per page.
+
+Usage in a revision script:
+
+    from migration_helpers import autocommit_execute, paged_migrate
+
+    session = Session(bind=op.get_bind())
+    for rows in paged_migrate(session, MessageModel):
+        ...
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from sqlalchemy import inspect, select, tuple_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Executable
+
+from alembic import op
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def paged_migrate(
+    session: Session,
+    model: type[Any],
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[Sequence[Any]]:
+    """
+    Yield ORM rows of a model one page at a time.
+
+    Pages use keyset pagination (WHERE pk > last ORDER BY pk LIMIT n), so
+    each page is an index range scan and callers may update or delete rows
+    of the current page without shifting later pages. Pending changes are
+    flushed and the identity map is cleared after each page.
+
+    Args:
+        session: Session bound to the migration connection.
+        model: Mapped ORM class to scan.
+        page_size: Number of rows per page.
+
+    Yields:
+        Sequence of rows for the current page.
+    """
+    primary_key = inspect(model).primary_key
+    key = primary_key[0] if len(primary_key) == 1 else tuple_(*primary_key)
+    query = select(model).order_by(*primary_key).limit(page_size)
+    last_key: tuple[Any, ...] | None = None
+    while True:
+        page_query = query
+        if last_key is not None:
+            bound = last_key[0] if len(last_key) == 1 else tuple_(*last_key)
+            page_query = query.where(key > bound)
+        rows = session.scalars(page_query).all()
+        if not rows:
+            return
+        # Read before the caller can delete the row or the page is expunged
+        last_key = inspect(rows[-1]).identity
+        yield rows
+        session.flush()
+        session.expunge_all()
+
+
+def iter_rows(
+    session: Session,
+    model: type[Any],
+    batch_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[Any]:
+    """
+    Stream ORM rows for read-only scans using a server-side cursor.
+
+    Args:
+        session: Session bound to the migration connection.
+        model: Mapped ORM class to scan.
+        batch_size: Number of rows buffered per fetch.
+
+    Yields:
+        One row at a time.
+    """
+    yield from session.scalars(select(model).execution_options(yield_per=batch_size))
+
+
+def autocommit_execute(statement: Executable) -> None:
+    """
+    Execute a write outside the surrounding migration transaction.
+
+    Args:
+        statement: The UPDATE/INSERT/DELETE statement to run.
+    """
+    with op.get_context().autocommit_block():
+        op.get_bind().execute(statement)
@@ -3,26 +3,35 @@ Application DTOs - Use Case DTOs only.
 
 These are dataclass-based DTOs for use case input/output.
 API DTOs (Pydantic) are in infrastructure/api/schemas/.
+
+Exports are resolved lazily (PEP 562): use_case_dtos is only imported
+the first time one of its names is accessed through this package.
 """
 
-from src.application.dtos.use_case_dtos import (
-    ConversationDetailOutput,
-    ConversationOutput,
-    ConversationStatusOutput,
-    CorrectionOutput,
-    CreateConversationInput,
-    FeedbackOutput,
-    MessageOutput,
-    RateFeedbackInput,
-    RequestFeedbackInput,
-    SendMessageInput,
-    SendMessageOutput,
-    SynthesisOutput,
-    SynthesizeInput,
-    TranscribeInput,
-    TranscriptionOutput,
-    ConversationSummaryOutput,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.application.dtos.use_case_dtos import (
+        ConversationDetailOutput,
+        ConversationOutput,
+        ConversationStatusOutput,
+        ConversationSummaryOutput,
+        CorrectionOutput,
+        CreateConversationInput,
+        CreateSummaryInput,
+        FeedbackOutput,
+        MessageOutput,
+        RateFeedbackInput,
+        RequestFeedbackInput,
+        SendMessageInput,
+        SendMessageOutput,
+        SynthesisOutput,
+        SynthesizeInput,
+        TranscribeInput,
+        TranscriptionOutput,
+    )
 
 __all__ = [
     # Conversation
@@ -46,4 +55,21 @@ __all__ = [
     "TranscriptionOutput",
     # Summary
     "ConversationSummaryOutput",
+    "CreateSummaryInput",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import DTOs from use_case_dtos on first access and cache them."""
+    if name in __all__:
+        from src.application.dtos import use_case_dtos
+
+        value = getattr(use_case_dtos, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List the lazily exported DTO names."""
+    return sorted(__all__)
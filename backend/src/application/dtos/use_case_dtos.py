@@ -7,11 +7,15 @@ Output DTOs: Carry data OUT of use cases (results)
 
 IMPORTANT: These are NOT Pydantic models - they are simple dataclasses.
 Pydantic models live in the API DTOs (conversation.py, message.py) for HTTP serialization.
+
+Output DTOs built once per row by the mappers (conversation, message, feedback,
+correction, summary) are not frozen: frozen dataclasses route every field
+through object.__setattr__ in __init__, and nothing mutates these after mapping.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
@@ -20,7 +24,7 @@ from uuid import UUID
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateConversationInput:
     """Input for creating a new conversation."""
 
@@ -28,7 +32,7 @@ class CreateConversationInput:
     tone: str  # String representation of tone (e.g., "formal", "friendly")
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class ConversationOutput:
     """Output representing a conversation."""
 
@@ -42,7 +46,7 @@ class ConversationOutput:
     last_message: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConversationStatusOutput:
     """Output for status change operations (archive/restore/end)."""
 
@@ -55,7 +59,7 @@ class ConversationStatusOutput:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SendMessageInput:
     """Input for sending a message."""
 
@@ -63,7 +67,7 @@ class SendMessageInput:
     content: str
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class MessageOutput:
     """Output representing a message."""
 
@@ -74,7 +78,7 @@ class MessageOutput:
     feedback: FeedbackOutput | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SendMessageOutput:
     """Output for send message operation."""
 
@@ -87,14 +91,14 @@ class SendMessageOutput:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RequestFeedbackInput:
     """Input for requesting feedback on a message."""
 
     message_id: UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RateFeedbackInput:
     """Input for rating feedback."""
 
@@ -103,7 +107,7 @@ class RateFeedbackInput:
     comment: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class CorrectionOutput:
     """Output representing a single correction."""
 
@@ -113,13 +117,13 @@ class CorrectionOutput:
     correction_type: str  # "grammar", "vocabulary", "phrasing"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class FeedbackOutput:
     """Output representing feedback."""
 
     id: UUID
-    corrections: tuple[CorrectionOutput, ...] = field(default_factory=tuple)
-    suggestions: tuple[str, ...] = field(default_factory=tuple)
+    corrections: tuple[CorrectionOutput, ...] = ()
+    suggestions: tuple[str, ...] = ()
     created_at: datetime | None = None
     user_rating: bool | None = None
     user_comment: str | None = None
@@ -130,14 +134,14 @@ class FeedbackOutput:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranscribeInput:
     """Input for transcribing audio."""
 
     audio_bytes: bytes
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranscriptionOutput:
     """Output from transcription."""
 
@@ -146,14 +150,14 @@ class TranscriptionOutput:
     duration_seconds: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SynthesizeInput:
     """Input for synthesizing speech."""
 
     text: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SynthesisOutput:
     """Output from speech synthesis."""
 
@@ -166,21 +170,21 @@ class SynthesisOutput:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateSummaryInput:
     """Input for creating a conversation summary."""
 
     conversation_id: UUID
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class ConversationSummaryOutput:
     """Output representing a conversation summary."""
 
     id: UUID
     fluency_score: int
-    strengths: tuple[str, ...] = field(default_factory=tuple)
-    weaknesses: tuple[str, ...] = field(default_factory=tuple)
+    strengths: tuple[str, ...] = ()
+    weaknesses: tuple[str, ...] = ()
     overall_remarks: str = ""
     created_at: datetime | None = None
 
@@ -190,7 +194,7 @@ class ConversationSummaryOutput:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConversationDetailOutput:
     """Output for detailed conversation with messages."""
 
@@ -200,7 +204,7 @@ class ConversationDetailOutput:
     status: str
     created_at: datetime
     updated_at: datetime
-    messages: tuple[MessageOutput, ...] = field(default_factory=tuple)
+    messages: tuple[MessageOutput, ...] = ()
     summary: ConversationSummaryOutput | None = None
 
 
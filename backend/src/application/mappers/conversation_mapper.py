@@ -9,6 +9,7 @@ from src.application.dtos.use_case_dtos import (
     ConversationOutput,
     ConversationStatusOutput,
 )
+from src.application.mappers.message_mapper import MessageMapper
 from src.core.entities.conversation import Conversation
 
 
@@ -26,9 +27,9 @@ class ConversationMapper:
         Returns:
             ConversationOutput DTO with summary information.
         """
-        last_message = None
-        if entity.messages:
-            last_message = entity.messages[-1].content
+        messages = entity.messages
+        message_count = len(messages)
+        last_message = messages[-1].content if message_count else None
 
         return ConversationOutput(
             id=entity.id,
@@ -37,7 +38,7 @@ class ConversationMapper:
             status=entity.status.value,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
-            message_count=len(entity.messages),
+            message_count=message_count,
             last_message=last_message,
         )
 
@@ -52,9 +53,7 @@ class ConversationMapper:
         Returns:
             ConversationDetailOutput DTO including all messages.
         """
-        from src.application.mappers.message_mapper import MessageMapper
-
-        messages = tuple(MessageMapper.to_output(m) for m in entity.messages)
+        messages = tuple(map(MessageMapper.to_output, entity.messages))
 
         return ConversationDetailOutput(
             id=entity.id,
@@ -23,19 +23,24 @@ class FeedbackMapper:
             FeedbackOutput DTO (dataclass).
         """
         corrections = tuple(
-            CorrectionOutput(
-                original=c.original,
-                corrected=c.corrected,
-                explanation=c.explanation,
-                correction_type=c.correction_type.value,
-            )
-            for c in feedback.corrections
+            [
+                CorrectionOutput(
+                    original=c.original,
+                    corrected=c.corrected,
+                    explanation=c.explanation,
+                    correction_type=c.correction_type.value,
+                )
+                for c in feedback.corrections
+            ]
         )
+        suggestions = feedback.suggestions
 
         return FeedbackOutput(
             id=feedback.id,
             corrections=corrections,
-            suggestions=tuple(feedback.suggestions),
+            suggestions=(
+                suggestions if isinstance(suggestions, tuple) else tuple(suggestions)
+            ),
             created_at=feedback.created_at,
             user_rating=feedback.user_rating,
             user_comment=feedback.user_comment,
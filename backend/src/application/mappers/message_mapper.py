@@ -22,14 +22,14 @@ class MessageMapper:
         Returns:
             MessageOutput DTO.
         """
-        feedback_dto = None
-        if entity.feedback:
-            feedback_dto = FeedbackMapper.to_output(entity.feedback)
+        feedback = entity.feedback
 
         return MessageOutput(
             id=entity.id,
             content=entity.content,
             role=entity.role.value,
             created_at=entity.created_at,
-            feedback=feedback_dto,
+            feedback=(
+                FeedbackMapper.to_output(feedback) if feedback is not None else None
+            ),
         )
@@ -22,11 +22,16 @@ class SummaryMapper:
         Returns:
             ConversationSummaryOutput DTO.
         """
+        strengths = summary.strengths
+        weaknesses = summary.weaknesses
+
         return ConversationSummaryOutput(
             id=summary.id,
             fluency_score=summary.fluency_score,
-            strengths=tuple(summary.strengths),
-            weaknesses=tuple(summary.weaknesses),
+            strengths=strengths if isinstance(strengths, tuple) else tuple(strengths),
+            weaknesses=(
+                weaknesses if isinstance(weaknesses, tuple) else tuple(weaknesses)
+            ),
             overall_remarks=summary.overall_remarks,
             created_at=summary.created_at,
         )
@@ -55,7 +55,7 @@ class ConversationQueries:
             List of conversation summary DTOs.
         """
         conversations = await self._repository.list_all()
-        return [ConversationMapper.to_output(c) for c in conversations]
+        return list(map(ConversationMapper.to_output, conversations))
 
     async def list_by_status(
         self, status: ConversationStatus
@@ -70,5 +70,5 @@ class ConversationQueries:
             List of conversation summary DTOs with the given status.
         """
         conversations = await self._repository.list_by_status(status)
-        return [ConversationMapper.to_output(c) for c in conversations]
+        return list(map(ConversationMapper.to_output, conversations))
 
@@ -14,6 +14,8 @@ from src.core.entities import Conversation
 from src.core.ports import ConversationRepository
 from src.core.value_objects import ConversationTone
 
+_TONE_CACHE: dict[str, ConversationTone] = {t.value: t for t in ConversationTone}
+
 
 class CreateConversation:
     """
@@ -45,8 +47,8 @@ class CreateConversation:
             InvalidContextError: If context_topic is invalid.
             ValueError: If tone is invalid.
         """
-        # Map string tone to domain enum
-        tone = ConversationTone(input_dto.tone)
+        # Map string tone to domain enum (enum call only raises for unknown values)
+        tone = _TONE_CACHE.get(input_dto.tone) or ConversationTone(input_dto.tone)
 
         # Create domain entity
         conversation = Conversation.create(
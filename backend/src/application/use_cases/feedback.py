@@ -57,14 +57,11 @@ class FeedbackUseCases:
         # Record feedback request metric
         self._metrics.record_request()
 
-        # Get conversation containing the message
-        conversation = await self._repository.get_by_message_id(input_dto.message_id)
+        # Fetch only the message, not the whole conversation
+        message = await self._repository.get_message_by_id(input_dto.message_id)
 
-        # Find the message in the conversation
-        message = next(
-            (m for m in conversation.messages if m.id == input_dto.message_id),
-            None,
-        )
+        # Reject before the LLM call rather than after it
+        message.ensure_can_receive_feedback()
 
         # Analyze message with feedback provider
         feedback = await self._feedback_provider.analyze_message(message)
@@ -72,8 +69,8 @@ class FeedbackUseCases:
         # Attach feedback to message
         message.attach_feedback(feedback)
 
-        # Persist updated conversation
-        await self._repository.save(conversation)
+        # Persist only this message and its new feedback
+        await self._repository.update_message(message)
 
         return FeedbackMapper.to_output(feedback)
 
@@ -91,29 +88,22 @@ class FeedbackUseCases:
             MessageNotFoundError: If message not found.
             FeedbackNotFoundError: If message has no feedback.
         """
-        conversation = await self._repository.get_by_message_id(input_dto.message_id)
-
-        # Find the message
-        message = next(
-            (m for m in conversation.messages if m.id == input_dto.message_id),
-            None,
-        )
+        message = await self._repository.get_message_by_id(input_dto.message_id)
 
         # Check feedback exists
-        if message is None or message.feedback is None:
+        if message.feedback is None:
             raise FeedbackNotFoundError(
                 f"Feedback for message {input_dto.message_id} not found"
             )
 
-        # Rate the feedback
+        # Rating rules live on the entity
         message.feedback.rate(rating=input_dto.rating, comment=input_dto.comment)
 
         # Record satisfaction metrics via port
         self._metrics.record_rating(helpful=input_dto.rating)
         self._metrics.record_satisfaction(1.0 if input_dto.rating else 0.0)
 
-        # Save the conversation
-        await self._repository.save(conversation)
+        # Persist only this message and its updated feedback
+        await self._repository.update_message(message)
 
         return FeedbackMapper.to_output(message.feedback)
-
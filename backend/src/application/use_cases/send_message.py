@@ -5,12 +5,23 @@ Orchestrates sending a message and receiving a coach response.
 Uses DTOs for input and output.
 """
 
+import asyncio
+import hashlib
+import time
 from collections.abc import AsyncIterator
+from io import StringIO
 
 from src.application.dtos.use_case_dtos import SendMessageInput, SendMessageOutput
 from src.application.mappers import MessageMapper
-from src.core.entities import MessageRole
-from src.core.ports import ConversationPartner, ConversationRepository
+from src.core.entities import Conversation, MessageRole
+from src.core.ports import (
+    ConversationCache,
+    ConversationPartner,
+    ConversationRepository,
+)
+
+# Number of trailing messages that make up a response cache key
+CACHE_WINDOW = 6
 
 
 class SendMessage:
@@ -24,6 +35,7 @@ class SendMessage:
         self,
         repository: ConversationRepository,
         partner: ConversationPartner,
+        cache: ConversationCache | None = None,
     ) -> None:
         """
         Initialize with dependencies.
@@ -31,9 +43,11 @@ class SendMessage:
         Args:
             repository: Port for conversation persistence.
             partner: Port for generating responses.
+            cache: Optional port for reusing responses to identical contexts.
         """
         self._repository = repository
         self._partner = partner
+        self._cache = cache
 
     async def execute(self, input_dto: SendMessageInput) -> SendMessageOutput:
         """
@@ -50,18 +64,16 @@ class SendMessage:
         # Add user message
         user_message = conversation.add_message(input_dto.content, MessageRole.USER)
 
-        # Generate coach response with tone
-        response_content = await self._partner.generate_response(
-            context=conversation.context_topic,
-            messages=conversation.messages,
-            tone=conversation.tone,
-        )
+        # Generate coach response with tone (or reuse a cached one)
+        response_content = await self._generate_response(conversation)
 
         # Add coach message
         coach_message = conversation.add_message(response_content, MessageRole.COACH)
 
-        # Persist
-        await self._repository.save(conversation)
+        # Persist both new messages in one batch
+        await self._repository.append_messages(
+            conversation.id, [user_message, coach_message]
+        )
 
         return SendMessageOutput(
             user_message=MessageMapper.to_output(user_message),
@@ -69,39 +81,113 @@ class SendMessage:
         )
 
     async def execute_stream(
-        self, input_dto: SendMessageInput
+        self,
+        input_dto: SendMessageInput,
+        *,
+        flush_every_n_tokens: int = 8,
+        flush_every_ms: float = 25,
     ) -> AsyncIterator[str]:
         """
         Send a user message and stream the coach response.
 
-        Persists user message immediately, then streams tokens.
-        Coach message is persisted after streaming completes.
+        The user message write runs concurrently with the start of the
+        stream and is awaited (shielded from cancellation) before returning,
+        even if streaming fails. A save failure is raised on success; if the
+        stream already failed or was cancelled, that error propagates with
+        the save failure attached as a note. Coach message is persisted after streaming
+        completes. Each message is appended on its own rather than
+        re-saving the whole conversation.
+
+        Tokens are coalesced into chunks: a chunk is yielded once it holds
+        flush_every_n_tokens tokens or flush_every_ms has elapsed since the
+        previous chunk, whichever comes first.
 
         Args:
             input_dto: Contains conversation_id and message content.
+            flush_every_n_tokens: Maximum number of tokens per chunk.
+            flush_every_ms: Maximum time to hold tokens before yielding.
 
         Yields:
-            Token strings as they are generated.
+            Chunks of the coach response as they are generated.
         """
         conversation = await self._repository.get_active(input_dto.conversation_id)
 
-        # Add and persist user message before streaming
-        _ = conversation.add_message(input_dto.content, MessageRole.USER)
-        await self._repository.save(conversation)
+        # Persist user message while the partner starts generating
+        user_message = conversation.add_message(input_dto.content, MessageRole.USER)
+        user_save = asyncio.create_task(
+            self._repository.append_message(conversation.id, user_message)
+        )
 
         # Accumulate coach response during streaming
-        full_response: list[str] = []
+        full_response = StringIO()
+        buffer: list[str] = []
+        last_flush = time.monotonic()
+
+        try:
+            async for token in self._partner.generate_response_stream(
+                context=conversation.context_topic,
+                messages=conversation.messages,
+                tone=conversation.tone,
+            ):
+                full_response.write(token)
+                buffer.append(token)
+                now = time.monotonic()
+                if (
+                    len(buffer) >= flush_every_n_tokens
+                    or (now - last_flush) * 1000 >= flush_every_ms
+                ):
+                    yield "".join(buffer)
+                    buffer.clear()
+                    last_flush = now
+
+            if buffer:
+                yield "".join(buffer)
+        except BaseException as exc:
+            # User message is kept even if streaming fails or is cancelled;
+            # a failed save must not replace the error already propagating
+            try:
+                await asyncio.shield(user_save)
+            except Exception as save_error:
+                exc.add_note(f"Saving the user message also failed: {save_error!r}")
+            raise
+
+        await asyncio.shield(user_save)
 
-        async for token in self._partner.generate_response_stream(
+        # Only persist coach message on successful completion
+        coach_content = full_response.getvalue()
+        if coach_content:
+            coach_message = conversation.add_message(coach_content, MessageRole.COACH)
+            await self._repository.append_message(conversation.id, coach_message)
+
+    async def _generate_response(self, conversation: Conversation) -> str:
+        """Ask the partner for a reply, going through the cache when configured."""
+        cache_key: bytes | None = None
+        if self._cache is not None:
+            cache_key = self._cache_key(conversation)
+            cached = await self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        response = await self._partner.generate_response(
             context=conversation.context_topic,
             messages=conversation.messages,
             tone=conversation.tone,
-        ):
-            full_response.append(token)
-            yield token
+        )
 
-        # Only persist coach message on successful completion
-        coach_content = "".join(full_response)
-        if coach_content:
-            _ = conversation.add_message(coach_content, MessageRole.COACH)
-            await self._repository.save(conversation)
+        if self._cache is not None and cache_key is not None:
+            await self._cache.put(cache_key, response)
+        return response
+
+    @staticmethod
+    def _cache_key(conversation: Conversation) -> bytes:
+        """Digest topic, tone and the last CACHE_WINDOW messages."""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(conversation.context_topic.encode())
+        hasher.update(b"\x00")
+        hasher.update(conversation.tone.value.encode())
+        for message in conversation.messages[-CACHE_WINDOW:]:
+            hasher.update(b"\x00")
+            hasher.update(message.role.encode())
+            hasher.update(b"\x01")
+            hasher.update(message.content.encode())
+        return hasher.digest()
@@ -5,6 +5,8 @@ Operations for speech-to-text and text-to-speech.
 All operations use DTOs for input and output.
 """
 
+from collections.abc import AsyncIterator
+
 from src.application.dtos.use_case_dtos import (
     SynthesisOutput,
     SynthesizeInput,
@@ -86,3 +88,29 @@ class SpeechUseCases:
             audio_bytes=audio_bytes,
             format="mp3",
         )
+
+    async def synthesize_stream(
+        self, input_dto: SynthesizeInput
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize text to speech audio, streaming chunks as they arrive.
+
+        Playback can start before synthesis completes, and the full audio
+        is never held in memory.
+
+        Args:
+            input_dto: Contains text to synthesize.
+
+        Yields:
+            Successive chunks of MP3 audio.
+
+        Raises:
+            ValueError: If synthesizer not configured.
+            PartnerConnectionError: If connection to synthesis service fails.
+            PartnerResponseError: If synthesis service returns an error.
+        """
+        if self._synthesizer is None:
+            raise ValueError("Speech synthesizer not configured")
+
+        async for chunk in self._synthesizer.synthesize_stream(input_dto.text):
+            yield chunk
@@ -0,0 +1,16 @@
+"""
+Domain clock shared by all entities.
+
+Entities call clock.utc_now() through the module attribute (never a bound
+reference), so tests can freeze time for the whole domain by patching
+src.core.clock.utc_now.
+
+ZERO external imports - pure Python standard library only.
+"""
+
+from datetime import UTC, datetime
+
+
+def utc_now() -> datetime:
+    """Return the current UTC time."""
+    return datetime.now(UTC)
@@ -10,10 +10,11 @@ ZERO external imports - pure Python standard library only.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from src.core import clock
 from src.core.entities.message import Message, MessageRole
 from src.core.exceptions import InvalidContextError, InvalidConversationStateError
 from src.core.value_objects import ConversationStatus, ConversationTone
@@ -22,7 +23,13 @@ if TYPE_CHECKING:
     from src.core.entities.conversation_summary import ConversationSummary
 
 
-@dataclass
+# Enum members are singletons: bound once for identity checks in properties
+_ACTIVE = ConversationStatus.ACTIVE
+_ARCHIVED = ConversationStatus.ARCHIVED
+_COMPLETED = ConversationStatus.COMPLETED
+
+
+@dataclass(slots=True)
 class Conversation:
     """
     A conversation session between user and coach.
@@ -42,23 +49,23 @@ class Conversation:
     id: UUID
     context_topic: str
     messages: list[Message] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=lambda: clock.utc_now())
+    updated_at: datetime = field(default_factory=lambda: clock.utc_now())
     status: ConversationStatus = ConversationStatus.ACTIVE
     tone: ConversationTone = field(default=ConversationTone.FRIENDLY)
     summary: ConversationSummary | None = None
 
     @property
     def is_active(self) -> bool:
-        return self.status == ConversationStatus.ACTIVE
+        return self.status is _ACTIVE
 
     @property
     def is_archived(self) -> bool:
-        return self.status == ConversationStatus.ARCHIVED
+        return self.status is _ARCHIVED
 
     @property
     def is_completed(self) -> bool:
-        return self.status == ConversationStatus.COMPLETED
+        return self.status is _COMPLETED
 
     @classmethod
     def create(
@@ -79,13 +86,15 @@ class Conversation:
         Raises:
             InvalidContextError: If context_topic is empty or whitespace-only.
         """
-        if not context_topic or not context_topic.strip():
+        # Strip once and reuse the result for both validation and storage
+        topic = context_topic.strip() if context_topic else ""
+        if not topic:
             raise InvalidContextError("Context topic cannot be empty")
 
-        now = datetime.now(UTC)
+        now = clock.utc_now()
         return cls(
             id=uuid4(),
-            context_topic=context_topic.strip(),
+            context_topic=topic,
             messages=[],
             created_at=now,
             updated_at=now,
@@ -148,7 +157,7 @@ class Conversation:
                 "Cannot archive a completed conversation"
             )
         self.status = ConversationStatus.ARCHIVED
-        self._touch()
+        self.updated_at = clock.utc_now()
 
     def restore(self) -> None:
         """
@@ -160,7 +169,7 @@ class Conversation:
         if self.status == ConversationStatus.ACTIVE:
             raise InvalidConversationStateError("Conversation is already active")
         self.status = ConversationStatus.ACTIVE
-        self._touch()
+        self.updated_at = clock.utc_now()
 
     def end(self) -> None:
         """Mark conversation as completed."""
@@ -171,11 +180,7 @@ class Conversation:
                 "Cannot complete an archived conversation"
             )
         self.status = ConversationStatus.COMPLETED
-        self._touch()
-
-    def _touch(self) -> None:
-        """Update the updated_at timestamp."""
-        self.updated_at = datetime.now(UTC)
+        self.updated_at = clock.utc_now()
 
     def add_message(self, content: str, role: MessageRole) -> Message:
         """
@@ -192,7 +197,8 @@ class Conversation:
         """
         message = Message.create(content=content, role=role)
         self.messages.append(message)
-        self._touch()
+        # Share the message's clock read instead of taking a new one
+        self.updated_at = message.created_at
         return message
 
     def attach_summary(self, summary: ConversationSummary) -> None:
@@ -212,4 +218,4 @@ class Conversation:
         if self.summary is not None:
             raise InvalidConversationStateError("Conversation already has a summary")
         self.summary = summary
-        self._touch()
+        self.updated_at = clock.utc_now()
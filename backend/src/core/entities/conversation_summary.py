@@ -10,13 +10,14 @@ ZERO external imports - pure Python standard library only.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import datetime
 from uuid import UUID, uuid4
 
+from src.core import clock
 from src.core.exceptions import InvalidFeedbackError
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationSummary:
     """
     Summary generated when a conversation is completed.
@@ -37,7 +38,7 @@ class ConversationSummary:
     strengths: list[str] = field(default_factory=list)
     weaknesses: list[str] = field(default_factory=list)
     overall_remarks: str = ""
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=lambda: clock.utc_now())
 
     @classmethod
     def create(
@@ -73,7 +74,7 @@ class ConversationSummary:
             strengths=strengths,
             weaknesses=weaknesses,
             overall_remarks=overall_remarks,
-            created_at=datetime.now(UTC),
+            created_at=clock.utc_now(),
         )
 
     @classmethod
@@ -10,13 +10,14 @@ ZERO external imports - pure Python standard library only.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import datetime
 from uuid import UUID, uuid4
 
+from src.core import clock
 from src.core.value_objects import Correction
 
 
-@dataclass
+@dataclass(slots=True)
 class Feedback:
     """
     Feedback on a user message containing corrections and suggestions.
@@ -33,7 +34,7 @@ class Feedback:
     id: UUID
     corrections: list[Correction] = field(default_factory=list)
     suggestions: list[str] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=lambda: clock.utc_now())
     user_rating: bool | None = None
     user_comment: str | None = None
 
@@ -58,7 +59,7 @@ class Feedback:
             id=uuid4(),
             corrections=corrections,
             suggestions=suggestions,
-            created_at=datetime.now(UTC),
+            created_at=clock.utc_now(),
         )
 
     @classmethod
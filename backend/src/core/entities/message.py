@@ -10,25 +10,30 @@ ZERO external imports - pure Python standard library only.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import UTC, datetime
-from enum import Enum
+from datetime import datetime
+from enum import StrEnum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from src.core import clock
 from src.core.exceptions import InvalidMessageContentError
 
 if TYPE_CHECKING:
     from src.core.entities.feedback import Feedback
 
 
-class MessageRole(Enum):
+class MessageRole(StrEnum):
     """Role of the message sender in a conversation."""
 
     USER = "user"
     COACH = "coach"
 
 
-@dataclass
+# Enum members are singletons: bound once for identity checks on hot paths
+_USER = MessageRole.USER
+
+
+@dataclass(slots=True)
 class Message:
     """
     A single message within a conversation.
@@ -66,14 +71,15 @@ class Message:
         Raises:
             InvalidMessageContentError: If content is empty or whitespace-only.
         """
-        if not content or not content.strip():
+        # isspace() scans without allocating a stripped copy
+        if not content or content.isspace():
             raise InvalidMessageContentError("Message content cannot be empty")
 
         return cls(
             id=uuid4(),
             content=content,
             role=role,
-            created_at=datetime.now(UTC),
+            created_at=clock.utc_now(),
             feedback=None,
         )
 
@@ -119,8 +125,19 @@ class Message:
         Raises:
             InvalidMessageContentError: If message is not from USER or already has feedback.
         """
-        if self.role != MessageRole.USER:
+        self.ensure_can_receive_feedback()
+        self.feedback = feedback
+
+    def ensure_can_receive_feedback(self) -> None:
+        """
+        Check that feedback may be attached to this message.
+
+        Lets callers reject a request before running a costly analysis.
+
+        Raises:
+            InvalidMessageContentError: If message is not from USER or already has feedback.
+        """
+        if self.role is not _USER:
             raise InvalidMessageContentError("Only user messages can receive feedback")
         if self.feedback is not None:
             raise InvalidMessageContentError("Message already has feedback")
-        self.feedback = feedback
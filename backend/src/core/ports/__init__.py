@@ -1,5 +1,6 @@
 """Core ports - Protocol interfaces for infrastructure adapters."""
 
+from src.core.ports.conversation_cache import ConversationCache
 from src.core.ports.conversation_partner import ConversationPartner
 from src.core.ports.conversation_repository import ConversationRepository
 from src.core.ports.feedback_provider import FeedbackProvider
@@ -8,6 +9,7 @@ from src.core.ports.speech import SpeechRecognizer, SpeechSynthesizer
 from src.core.ports.summary_provider import SummaryProvider
 
 __all__ = [
+    "ConversationCache",
     "ConversationPartner",
     "ConversationRepository",
     "FeedbackMetrics",
@@ -0,0 +1,39 @@
+"""
+ConversationCache port for reusing coach responses.
+
+Port defines the contract for caching generated responses.
+Core layer must have ZERO external imports.
+"""
+
+from typing import Protocol
+
+
+class ConversationCache(Protocol):
+    """
+    Port for caching coach responses by conversation context.
+
+    Keys are opaque digests of the context a response was generated for.
+    Implementations must be in infrastructure layer.
+    """
+
+    async def get(self, key: bytes) -> str | None:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Digest of the conversation context.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        ...
+
+    async def put(self, key: bytes, value: str) -> None:
+        """
+        Store a response for later reuse.
+
+        Args:
+            key: Digest of the conversation context.
+            value: The coach response generated for that context.
+        """
+        ...
@@ -5,10 +5,12 @@ Port defines the contract for persistence operations.
 Core layer must have ZERO external imports.
 """
 
+from collections.abc import Sequence
 from typing import Protocol
 from uuid import UUID
 
 from src.core.entities.conversation import Conversation, ConversationStatus
+from src.core.entities.message import Message
 
 
 class ConversationRepository(Protocol):
@@ -16,6 +18,11 @@ class ConversationRepository(Protocol):
     Port for conversation persistence operations.
 
     Implementations must be in infrastructure layer.
+
+    Conversations returned by any method must have their messages fully
+    loaded: mappers read them synchronously, so lazy relationship loading
+    would issue one query per conversation. ORM-backed implementations
+    should eager-load messages in bulk (e.g. SQLAlchemy ``selectin``).
     """
 
     async def save(self, conversation: Conversation) -> None:
@@ -27,6 +34,34 @@ class ConversationRepository(Protocol):
         """
         ...
 
+    async def append_message(self, conversation_id: UUID, message: Message) -> None:
+        """
+        Persist a single new message of an existing conversation.
+
+        Inserts only the message row (and bumps the conversation's
+        updated_at) instead of rewriting the whole aggregate.
+
+        Args:
+            conversation_id: Identifier of the conversation owning the message.
+            message: The newly added message entity.
+        """
+        ...
+
+    async def append_messages(
+        self, conversation_id: UUID, messages: Sequence[Message]
+    ) -> None:
+        """
+        Persist several new messages of an existing conversation at once.
+
+        Batch variant of append_message(): implementations should insert
+        all rows in a single statement (multi-row INSERT / executemany).
+
+        Args:
+            conversation_id: Identifier of the conversation owning the messages.
+            messages: The newly added message entities, in order.
+        """
+        ...
+
     async def find(self, id: UUID) -> Conversation | None:
         """
         Retrieve a conversation by ID.
@@ -103,14 +138,29 @@ class ConversationRepository(Protocol):
         """
         ...
 
-    async def get_by_message_id(self, message_id: UUID) -> Conversation:
+    async def get_message_by_id(self, message_id: UUID) -> Message:
         """
-        Retrieve the conversation containing a specific message.
+        Retrieve a single message by ID without loading its conversation.
 
         Args:
             message_id: Identifier of the message.
 
         Returns:
-            The conversation containing the message.
+            The message, with its feedback if any.
+
+        Raises:
+            MessageNotFoundError: If no message with this ID exists.
+        """
+        ...
+
+    async def update_message(self, message: Message) -> None:
+        """
+        Persist changes to an existing message and its feedback.
+
+        Writes only this message's row (and its feedback record), without
+        rewriting the owning conversation or its other messages.
+
+        Args:
+            message: The message entity to update.
         """
         ...
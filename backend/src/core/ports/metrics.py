@@ -9,7 +9,13 @@ from typing import Protocol
 
 
 class FeedbackMetrics(Protocol):
-    """Protocol for feedback-related metrics."""
+    """
+    Protocol for feedback-related metrics.
+
+    Methods are called inline on the request path, so implementations must
+    not block: update in-process counters (e.g. Prometheus) and leave any
+    network export to a background collector.
+    """
 
     def record_request(self) -> None:
         """Record a feedback request."""
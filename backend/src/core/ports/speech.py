@@ -5,6 +5,7 @@ Port defines the contract for generating responses.
 Core layer must have ZERO external imports.
 """
 
+from collections.abc import AsyncIterator
 from typing import Protocol
 
 from src.core.value_objects import TranscriptionResult
@@ -48,3 +49,16 @@ class SpeechSynthesizer(Protocol):
             Audio bytes in MP3 format.
         """
         ...
+
+    async def synthesize_stream(self, text: str) -> AsyncIterator[bytes]:
+        """
+        Synthesize text to audio, yielding chunks as they arrive.
+
+        Args:
+            text: Text to convert to speech.
+
+        Yields:
+            Successive chunks of MP3 audio.
+        """
+        yield b""  # pragma: no cover
+        ...
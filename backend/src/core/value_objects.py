@@ -16,7 +16,7 @@ class CorrectionType(Enum):
     PHRASING = "phrasing"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Correction:
     """
     A single correction within feedback.
@@ -51,7 +51,7 @@ class ConversationTone(Enum):
     PATIENT = "patient"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranscriptionResult:
     """
     Result of speech-to-text transcription.
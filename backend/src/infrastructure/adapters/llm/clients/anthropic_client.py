@@ -7,9 +7,10 @@ Provides reusable client for any adapter needing Anthropic completions.
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
-from anthropic import AsyncAnthropic
+from anthropic import APIConnectionError, AsyncAnthropic
 
 from src.core.exceptions import PartnerConnectionError, PartnerResponseError
 from src.infrastructure.adapters.llm.clients.base import (
@@ -22,6 +23,50 @@ if TYPE_CHECKING:
     from anthropic.types import Message as AnthropicMessage
 
 
+def _split_system(
+    messages: list[LLMMessage],
+) -> tuple[str, list[dict[str, str]]]:
+    """
+    Separate the system prompt from the conversation turns in one pass.
+
+    The Messages API rejects a "system" role, so a system message is
+    pulled out wherever it appears; if there are several, the last wins.
+
+    Args:
+        messages: Messages, possibly including a system message.
+
+    Returns:
+        The system prompt ("" if absent) and the Anthropic message dicts.
+    """
+    system_content = ""
+    turns: list[dict[str, str]] = []
+    for m in messages:
+        if m.role == "system":
+            system_content = m.content
+        else:
+            turns.append({"role": m.role, "content": m.content})
+    return system_content, turns
+
+
+@lru_cache(maxsize=64)
+def _with_json_suffix(system: str) -> str:
+    """
+    Append the JSON-only instruction to a system prompt.
+
+    Cached because callers such as the feedback analyzer reuse one fixed
+    system prompt, so the concatenated string is built only once.
+
+    Args:
+        system: The system prompt ("" if absent).
+
+    Returns:
+        The system prompt with the JSON instruction.
+    """
+    if system:
+        return system + "\n\nIMPORTANT: Respond with valid JSON only."
+    return "Respond with valid JSON only."
+
+
 class AnthropicClient(BaseLLMClient):
     """
     Anthropic API client.
@@ -75,20 +120,11 @@ class AnthropicClient(BaseLLMClient):
             PartnerResponseError: If API returns error.
         """
         # Separate system message from conversation
-        system_content = ""
-        anthropic_messages = []
-
-        for msg in messages:
-            if msg.role == "system":
-                system_content = msg.content
-            else:
-                anthropic_messages.append({"role": msg.role, "content": msg.content})
+        system_content, anthropic_messages = _split_system(messages)
 
         # Add JSON instruction to system prompt if json_mode
-        if json_mode and system_content:
-            system_content += "\n\nIMPORTANT: Respond with valid JSON only."
-        elif json_mode:
-            system_content = "Respond with valid JSON only."
+        if json_mode:
+            system_content = _with_json_suffix(system_content)
 
         try:
             kwargs: dict[str, Any] = {
@@ -114,12 +150,10 @@ class AnthropicClient(BaseLLMClient):
                 raw_response=response,
             )
 
-        # Exceptions à définir plus tard
+        # APITimeoutError subclasses APIConnectionError
+        except APIConnectionError as e:
+            raise PartnerConnectionError(f"Cannot connect to Anthropic API: {e}") from e
         except Exception as e:
-            if "connection" in str(e).lower() or "timeout" in str(e).lower():
-                raise PartnerConnectionError(
-                    f"Cannot connect to Anthropic API: {e}"
-                ) from e
             raise PartnerResponseError(f"Anthropic API error: {e}") from e
 
     async def complete_stream(
@@ -145,14 +179,7 @@ class AnthropicClient(BaseLLMClient):
             PartnerResponseError: If API returns error.
         """
         # Separate system message from conversation
-        system_content = ""
-        anthropic_messages = []
-
-        for msg in messages:
-            if msg.role == "system":
-                system_content = msg.content
-            else:
-                anthropic_messages.append({"role": msg.role, "content": msg.content})
+        system_content, anthropic_messages = _split_system(messages)
 
         try:
             kwargs: dict[str, Any] = {
@@ -169,9 +196,8 @@ class AnthropicClient(BaseLLMClient):
                 async for text in stream.text_stream:
                     yield text
 
+        # APITimeoutError subclasses APIConnectionError
+        except APIConnectionError as e:
+            raise PartnerConnectionError(f"Cannot connect to Anthropic API: {e}") from e
         except Exception as e:
-            if "connection" in str(e).lower() or "timeout" in str(e).lower():
-                raise PartnerConnectionError(
-                    f"Cannot connect to Anthropic API: {e}"
-                ) from e
             raise PartnerResponseError(f"Anthropic API error: {e}") from e
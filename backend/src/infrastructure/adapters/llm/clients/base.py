@@ -10,10 +10,10 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Protocol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LLMMessage:
     """
     A single message in a conversation.
@@ -25,7 +25,7 @@ class LLMMessage:
     content: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LLMResponse:
     """
     Response from an LLM API call.
@@ -38,7 +38,6 @@ class LLMResponse:
     raw_response: Any = field(default=None, repr=False)
 
 
-@runtime_checkable
 class LLMClientProtocol(Protocol):
     """
     Protocol defining the interface all LLM clients must implement.
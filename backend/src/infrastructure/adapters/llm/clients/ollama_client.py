@@ -6,10 +6,12 @@ Provides reusable client for any adapter needing Ollama completions.
 
 from __future__ import annotations
 
+import asyncio
 import json
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from typing import Any
+import weakref
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
+from typing import Any, ClassVar
 
 import httpx
 
@@ -20,6 +22,81 @@ from src.infrastructure.adapters.llm.clients.base import (
     LLMResponse,
 )
 
+_DECODER = json.JSONDecoder()
+
+
+def _decode_frames(line: bytes | bytearray) -> list[dict[str, Any]]:
+    """
+    Decode one NDJSON line into its JSON objects.
+
+    A well-formed line holds a single object and takes one json.loads call.
+    Otherwise the line is scanned with raw_decode so that objects glued
+    together without a newline are still recovered; undecodable trailing
+    data is dropped. A line that is not valid UTF-8 is skipped whole, and
+    JSON values other than objects are ignored.
+
+    Args:
+        line: Raw bytes of one line, without the newline.
+
+    Returns:
+        The decoded objects, possibly empty.
+    """
+    try:
+        text = line.decode("utf-8")
+    except UnicodeDecodeError:
+        return []
+
+    try:
+        obj = json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    else:
+        return [obj] if isinstance(obj, dict) else []
+
+    frames: list[dict[str, Any]] = []
+    pos = text.find("{")
+    while pos != -1:
+        try:
+            obj, end = _DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            break
+        frames.append(obj)
+        pos = text.find("{", end)
+    return frames
+
+
+async def _iter_ndjson(
+    response: httpx.Response,
+) -> AsyncGenerator[dict[str, Any], None]:
+    """
+    Decode a newline-delimited JSON body as raw bytes arrive.
+
+    Lines are split from bytes directly, without decoding each chunk to str
+    first. Blank lines are skipped.
+
+    Args:
+        response: Streaming response with an NDJSON body.
+
+    Yields:
+        Each parsed JSON object, in order.
+    """
+    buffer = bytearray()
+    async for chunk in response.aiter_bytes():
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line = buffer[start:end]
+            start = end + 1
+            if line.strip():
+                for data in _decode_frames(line):
+                    yield data
+        del buffer[:start]
+
+    # Final line without a trailing newline
+    if buffer.strip():
+        for data in _decode_frames(buffer):
+            yield data
+
 
 class OllamaClient(BaseLLMClient):
     """
@@ -31,6 +108,13 @@ class OllamaClient(BaseLLMClient):
 
     provider_id = "ollama"
 
+    # Pooled clients shared by all instances, one per event loop. Keyed by
+    # the loop itself (not its id, which a later loop may reuse); an entry
+    # is dropped when its loop is garbage-collected.
+    _shared_clients: ClassVar[
+        weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]
+    ] = weakref.WeakKeyDictionary()
+
     def __init__(
         self,
         model: str = "llama3.2",
@@ -49,17 +133,56 @@ class OllamaClient(BaseLLMClient):
         """
         super().__init__(model)
         self.base_url = base_url.rstrip("/")
+        # Parsed once: httpx skips URL parsing when handed a URL instance
+        self._chat_url = httpx.URL(f"{self.base_url}/api/chat")
         self.timeout = timeout
         self._external_client = client
 
-    @asynccontextmanager
-    async def _get_client(self):
-        """Get HTTP client, managing lifecycle appropriately."""
-        if self._external_client:
-            yield self._external_client
-        else:
-            async with httpx.AsyncClient() as client:
-                yield client
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the HTTP client: the injected one, or the shared pooled client.
+
+        The shared client keeps connections alive across requests. It is
+        keyed by the running event loop because an httpx client cannot be
+        used from a loop other than the one it was created on.
+        """
+        if self._external_client is not None:
+            return self._external_client
+
+        loop = asyncio.get_running_loop()
+        client = self._shared_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_keepalive_connections=20, keepalive_expiry=30.0
+                ),
+            )
+            self._shared_clients[loop] = client
+        return client
+
+    @classmethod
+    async def aclose_shared(cls) -> None:
+        """Close the shared client of the running event loop (app shutdown)."""
+        client = cls._shared_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled client used by this instance.
+
+        An injected client belongs to the caller and is left open.
+        """
+        if self._external_client is None:
+            await self.aclose_shared()
+
+    async def __aenter__(self) -> OllamaClient:
+        """Enter an async context; the client is closed on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the pooled client on context exit."""
+        await self.aclose()
 
     async def complete(
         self,
@@ -101,13 +224,12 @@ class OllamaClient(BaseLLMClient):
             payload["format"] = "json"
 
         try:
-            async with self._get_client() as client:
-                response = await client.post(
-                    f"{self.base_url}/api/chat",
-                    json=payload,
-                    timeout=self.timeout,
-                )
-                response.raise_for_status()
+            response = await self._get_client().post(
+                self._chat_url,
+                json=payload,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
 
         except httpx.TimeoutException as e:
             raise PartnerConnectionError(
@@ -175,23 +297,16 @@ class OllamaClient(BaseLLMClient):
             payload["options"]["num_predict"] = max_tokens
 
         try:
-            async with (
-                self._get_client() as client,
-                client.stream(
-                    "POST",
-                    f"{self.base_url}/api/chat",
-                    json=payload,
-                    timeout=self.timeout,
-                ) as response,
-            ):
+            async with self._get_client().stream(
+                "POST",
+                self._chat_url,
+                json=payload,
+                timeout=self.timeout,
+            ) as response:
                 response.raise_for_status()
 
-                async for line in response.aiter_lines():
-                    if not line:
-                        continue
-
-                    try:
-                        data = json.loads(line)
+                async with aclosing(_iter_ndjson(response)) as frames:
+                    async for data in frames:
                         content = data.get("message", {}).get("content", "")
 
                         if content:
@@ -200,9 +315,6 @@ class OllamaClient(BaseLLMClient):
                         if data.get("done", False):
                             break
 
-                    except json.JSONDecodeError:
-                        continue
-
         except httpx.TimeoutException as e:
             raise PartnerConnectionError(
                 f"Timeout connecting to Ollama at {self.base_url}: {e}"
@@ -6,10 +6,11 @@ Provides reusable client for any adapter needing OpenAI completions.
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
-from openai import AsyncOpenAI
+from openai import APIConnectionError, AsyncOpenAI
 
 from src.core.exceptions import PartnerConnectionError, PartnerResponseError
 from src.infrastructure.adapters.llm.clients.base import (
@@ -22,6 +23,26 @@ if TYPE_CHECKING:
     from openai.types.chat import ChatCompletion
 
 
+@contextmanager
+def _map_openai_errors() -> Iterator[None]:
+    """
+    Translate OpenAI SDK failures into domain exceptions.
+
+    APITimeoutError subclasses APIConnectionError, so both map to
+    PartnerConnectionError.
+
+    Raises:
+        PartnerConnectionError: If the API cannot be reached or times out.
+        PartnerResponseError: For any other failure.
+    """
+    try:
+        yield
+    except APIConnectionError as e:
+        raise PartnerConnectionError(f"Cannot connect to OpenAI API: {e}") from e
+    except Exception as e:
+        raise PartnerResponseError(f"OpenAI API error: {e}") from e
+
+
 class OpenAIClient(BaseLLMClient):
     """
     OpenAI API client.
@@ -75,7 +96,7 @@ class OpenAIClient(BaseLLMClient):
         """
         openai_messages = [{"role": m.role, "content": m.content} for m in messages]
 
-        try:
+        with _map_openai_errors():
             kwargs: dict[str, Any] = {
                 "model": self.model,
                 "messages": openai_messages,
@@ -100,14 +121,6 @@ class OpenAIClient(BaseLLMClient):
                 raw_response=response,
             )
 
-        # Exceptions à définir plus tard
-        except Exception as e:
-            if "connection" in str(e).lower() or "timeout" in str(e).lower():
-                raise PartnerConnectionError(
-                    f"Cannot connect to OpenAI API: {e}"
-                ) from e
-            raise PartnerResponseError(f"OpenAI API error: {e}") from e
-
     async def complete_stream(
         self,
         messages: list[LLMMessage],
@@ -132,7 +145,7 @@ class OpenAIClient(BaseLLMClient):
         """
         openai_messages = [{"role": m.role, "content": m.content} for m in messages]
 
-        try:
+        with _map_openai_errors():
             kwargs: dict[str, Any] = {
                 "model": self.model,
                 "messages": openai_messages,
@@ -148,10 +161,3 @@ class OpenAIClient(BaseLLMClient):
             async for chunk in stream:
                 if chunk.choices and chunk.choices[0].delta.content:
                     yield chunk.choices[0].delta.content
-
-        except Exception as e:
-            if "connection" in str(e).lower() or "timeout" in str(e).lower():
-                raise PartnerConnectionError(
-                    f"Cannot connect to OpenAI API: {e}"
-                ) from e
-            raise PartnerResponseError(f"OpenAI API error: {e}") from e
@@ -7,8 +7,8 @@ Pure data structures with no external dependencies.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from enum import Enum, auto
+from dataclasses import dataclass
+from enum import Enum, IntFlag, auto
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
@@ -16,11 +16,12 @@ if TYPE_CHECKING:
     from src.infrastructure.config.settings import Settings
 
 
-class ModelCapability(Enum):
+class ModelCapability(IntFlag):
     """
     Capabilities that a model can have.
 
-    Used to filter models for specific use cases.
+    Used to filter models for specific use cases. Members are bit flags,
+    so a model's capability set is a single combined value.
     """
 
     CHAT = auto()  # General conversation (ConversationPartner)
@@ -41,7 +42,7 @@ class ModelTier(Enum):
     STANDARD = "standard"  # Default tier
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelInfo:
     """
     Information about an available LLM model.
@@ -55,7 +56,7 @@ class ModelInfo:
         provider: Provider identifier (e.g., "openai").
         tier: Quality tier for UI badge (FAST, PRO, STANDARD).
         local: True for locally-running models (Ollama).
-        capabilities: Set of capabilities this model supports.
+        capabilities: Combined flags of the capabilities this model supports.
         recommended_for: Primary recommended use case (for UI hints).
     """
 
@@ -64,16 +65,14 @@ class ModelInfo:
     provider: str
     tier: ModelTier = ModelTier.STANDARD
     local: bool = False
-    capabilities: frozenset[ModelCapability] = field(
-        default_factory=lambda: frozenset(
-            {ModelCapability.CHAT, ModelCapability.FEEDBACK, ModelCapability.SUMMARY}
-        )
+    capabilities: ModelCapability = (
+        ModelCapability.CHAT | ModelCapability.FEEDBACK | ModelCapability.SUMMARY
     )
     recommended_for: ModelCapability | None = None
 
     def supports(self, capability: ModelCapability) -> bool:
-        """Check if this model supports a specific capability."""
-        return capability in self.capabilities
+        """Check if this model supports a capability (or all of combined flags)."""
+        return self.capabilities & capability == capability
 
 
 # Backwards compatibility alias
@@ -1,12 +1,12 @@
 """
-LLM Providers - Auto-discovered provider modules.
+LLM Providers - Provider modules loaded by the registry.
 
-Each provider module (*.py) in this package is automatically discovered
-and imported by the registry. Providers register themselves using the
-@register_provider decorator.
+Each module listed in the registry's _PROVIDER_MODULES table is imported
+on first use. Providers register themselves using the @register_provider
+decorator.
 
 To add a new provider:
 1. Create a new file (e.g., gemini.py) in this directory
 2. Implement a class with @register_provider decorator
-3. It will be auto-discovered at startup
+3. Add the module name and its SDK packages to _PROVIDER_MODULES in registry.py
 """
@@ -16,6 +16,36 @@ if TYPE_CHECKING:
     from src.infrastructure.config.settings import Settings
 
 
+# Built once at import: ModelInfo is frozen, so the instances are shared
+_ALL_CAPS = (
+    ModelCapability.CHAT
+    | ModelCapability.FEEDBACK
+    | ModelCapability.SUMMARY
+    | ModelCapability.JSON_MODE
+)
+
+_MODELS: tuple[ModelInfo, ...] = (
+    ModelInfo(
+        id="anthropic/claude-sonnet-4-20250514",
+        name="Claude Sonnet 4",
+        provider="anthropic",
+        tier=ModelTier.PRO,
+        local=False,
+        capabilities=_ALL_CAPS,
+        recommended_for=ModelCapability.CHAT,
+    ),
+    ModelInfo(
+        id="anthropic/claude-3-5-haiku-20241022",
+        name="Claude 3.5 Haiku",
+        provider="anthropic",
+        tier=ModelTier.FAST,
+        local=False,
+        capabilities=_ALL_CAPS,
+        recommended_for=ModelCapability.FEEDBACK,
+    ),
+)
+
+
 @register_provider
 class AnthropicProvider:
     """Anthropic provider - Claude models for all use cases."""
@@ -31,35 +61,7 @@ class AnthropicProvider:
     @staticmethod
     def list_models() -> list[ModelInfo]:
         """List available Anthropic models with capabilities."""
-        all_capabilities = frozenset(
-            {
-                ModelCapability.CHAT,
-                ModelCapability.FEEDBACK,
-                ModelCapability.SUMMARY,
-                ModelCapability.JSON_MODE,
-            }
-        )
-
-        return [
-            ModelInfo(
-                id="anthropic/claude-sonnet-4-20250514",
-                name="Claude Sonnet 4",
-                provider="anthropic",
-                tier=ModelTier.PRO,
-                local=False,
-                capabilities=all_capabilities,
-                recommended_for=ModelCapability.CHAT,
-            ),
-            ModelInfo(
-                id="anthropic/claude-3-5-haiku-20241022",
-                name="Claude 3.5 Haiku",
-                provider="anthropic",
-                tier=ModelTier.FAST,
-                local=False,
-                capabilities=all_capabilities,
-                recommended_for=ModelCapability.FEEDBACK,
-            ),
-        ]
+        return list(_MODELS)
 
     @staticmethod
     def create_client(model: str, settings: Settings) -> AnthropicClient:
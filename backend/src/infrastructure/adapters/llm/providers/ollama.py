@@ -16,6 +16,30 @@ if TYPE_CHECKING:
     from src.infrastructure.config.settings import Settings
 
 
+# Built once at import: ModelInfo is frozen, so the instances are shared
+_CHAT_CAPS = ModelCapability.CHAT | ModelCapability.FEEDBACK | ModelCapability.SUMMARY
+
+_MODELS: tuple[ModelInfo, ...] = (
+    ModelInfo(
+        id="ollama/llama3.2",
+        name="Llama 3.2",
+        provider="ollama",
+        tier=ModelTier.FAST,
+        local=True,
+        capabilities=_CHAT_CAPS,
+        recommended_for=ModelCapability.CHAT,
+    ),
+    ModelInfo(
+        id="ollama/gemma2.5:7b",
+        name="Gemma 2.5 7B",
+        provider="ollama",
+        tier=ModelTier.FAST,
+        local=True,
+        capabilities=_CHAT_CAPS,
+    ),
+)
+
+
 @register_provider
 class OllamaProvider:
     """Ollama provider - local LLM models (no API key required)."""
@@ -36,33 +60,7 @@ class OllamaProvider:
         Note: Could be enhanced to query Ollama /api/tags for installed models.
         Currently returns common defaults.
         """
-        chat_capabilities = frozenset(
-            {
-                ModelCapability.CHAT,
-                ModelCapability.FEEDBACK,
-                ModelCapability.SUMMARY,
-            }
-        )
-
-        return [
-            ModelInfo(
-                id="ollama/llama3.2",
-                name="Llama 3.2",
-                provider="ollama",
-                tier=ModelTier.FAST,
-                local=True,
-                capabilities=chat_capabilities,
-                recommended_for=ModelCapability.CHAT,
-            ),
-            ModelInfo(
-                id="ollama/gemma2.5:7b",
-                name="Gemma 2.5 7B",
-                provider="ollama",
-                tier=ModelTier.FAST,
-                local=True,
-                capabilities=chat_capabilities,
-            ),
-        ]
+        return list(_MODELS)
 
     @staticmethod
     def create_client(model: str, settings: Settings) -> OllamaClient:
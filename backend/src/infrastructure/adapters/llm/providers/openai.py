@@ -16,6 +16,44 @@ if TYPE_CHECKING:
     from src.infrastructure.config.settings import Settings
 
 
+# Built once at import: ModelInfo is frozen, so the instances are shared
+_ALL_CAPS = (
+    ModelCapability.CHAT
+    | ModelCapability.FEEDBACK
+    | ModelCapability.SUMMARY
+    | ModelCapability.JSON_MODE
+)
+
+_MODELS: tuple[ModelInfo, ...] = (
+    ModelInfo(
+        id="openai/gpt-4o",
+        name="GPT-4o",
+        provider="openai",
+        tier=ModelTier.PRO,
+        local=False,
+        capabilities=_ALL_CAPS,
+        recommended_for=ModelCapability.CHAT,
+    ),
+    ModelInfo(
+        id="openai/gpt-4o-mini",
+        name="GPT-4o Mini",
+        provider="openai",
+        tier=ModelTier.FAST,
+        local=False,
+        capabilities=_ALL_CAPS,
+        recommended_for=ModelCapability.FEEDBACK,
+    ),
+    ModelInfo(
+        id="openai/gpt-4-turbo",
+        name="GPT-4 Turbo",
+        provider="openai",
+        tier=ModelTier.PRO,
+        local=False,
+        capabilities=_ALL_CAPS,
+    ),
+)
+
+
 @register_provider
 class OpenAIProvider:
     """OpenAI provider - GPT models for all use cases."""
@@ -31,43 +69,7 @@ class OpenAIProvider:
     @staticmethod
     def list_models() -> list[ModelInfo]:
         """List available OpenAI models with capabilities."""
-        all_capabilities = frozenset(
-            {
-                ModelCapability.CHAT,
-                ModelCapability.FEEDBACK,
-                ModelCapability.SUMMARY,
-                ModelCapability.JSON_MODE,
-            }
-        )
-
-        return [
-            ModelInfo(
-                id="openai/gpt-4o",
-                name="GPT-4o",
-                provider="openai",
-                tier=ModelTier.PRO,
-                local=False,
-                capabilities=all_capabilities,
-                recommended_for=ModelCapability.CHAT,
-            ),
-            ModelInfo(
-                id="openai/gpt-4o-mini",
-                name="GPT-4o Mini",
-                provider="openai",
-                tier=ModelTier.FAST,
-                local=False,
-                capabilities=all_capabilities,
-                recommended_for=ModelCapability.FEEDBACK,
-            ),
-            ModelInfo(
-                id="openai/gpt-4-turbo",
-                name="GPT-4 Turbo",
-                provider="openai",
-                tier=ModelTier.PRO,
-                local=False,
-                capabilities=all_capabilities,
-            ),
-        ]
+        return list(_MODELS)
 
     @staticmethod
     def create_client(model: str, settings: Settings) -> OpenAIClient:
@@ -3,15 +3,15 @@ Unified Provider Registry for dynamic LLM provider management.
 
 Singleton registry with lazy loading for fast imports and tests.
 Provides clients for any use case (chat, feedback, summary).
-Auto-discovers providers from the providers/ package.
+Loads providers from a static module table in the providers/ package.
 """
 
 from __future__ import annotations
 
-import importlib
-import pkgutil
+import re
 import threading
-from pathlib import Path
+from importlib import import_module
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, TypeVar
 
 import structlog
@@ -31,8 +31,17 @@ T = TypeVar("T", bound=type)
 
 logger = structlog.get_logger(__name__)
 
-# Package path for auto-discovery
+# Provider modules imported on first use (no directory walk at startup),
+# each mapped to the SDK packages it needs
 _PROVIDERS_PACKAGE = "src.infrastructure.adapters.llm.providers"
+_PROVIDER_MODULES: dict[str, tuple[str, ...]] = {
+    "anthropic": ("anthropic",),
+    "ollama": ("httpx",),
+    "openai": ("openai",),
+}
+
+# "provider/model-name": non-empty provider, model name not starting with "/"
+_MODEL_ID_RE = re.compile(r"([^/]+)/([^/].*)", re.DOTALL)
 
 
 class ProviderRegistry:
@@ -47,16 +56,21 @@ class ProviderRegistry:
     """
 
     def __init__(self) -> None:
-        """Initialize with empty provider dict and thread lock."""
+        """Initialize with empty provider dict, model cache and thread lock."""
         self._providers: dict[str, type[ProviderProtocol]] = {}
+        # Static model lists per (provider, capability filter), built on demand
+        self._models_cache: dict[
+            tuple[str, ModelCapability | None], tuple[ModelInfo, ...]
+        ] = {}
         self._loaded = False
         self._lock = threading.Lock()
 
     def _ensure_loaded(self) -> None:
         """
-        Lazy load all providers on first use via auto-discovery.
+        Lazy load all providers on first use.
 
-        Auto-discovers and imports all modules in the providers/ package.
+        Imports every module listed in _PROVIDER_MODULES. Modules whose SDK
+        is not installed are skipped via find_spec, without being imported.
         Each module's @register_provider decorator triggers registration.
         Safe to call multiple times (idempotent).
         Thread-safe with double-check locking pattern.
@@ -72,35 +86,31 @@ class ProviderRegistry:
             logger.debug("loading_providers")
             errors: list[str] = []
 
-            # Auto-discover and import all provider modules
-            try:
-                providers_module = importlib.import_module(_PROVIDERS_PACKAGE)
-                providers_path = Path(providers_module.__file__).parent
-
-                for module_info in pkgutil.iter_modules([str(providers_path)]):
-                    module_name = module_info.name
-                    # Skip __init__ and private modules
-                    if module_name.startswith("_"):
-                        continue
-
-                    try:
-                        importlib.import_module(f"{_PROVIDERS_PACKAGE}.{module_name}")
-                        logger.debug("provider_module_loaded", module=module_name)
-                    except ImportError as e:
-                        logger.debug(
-                            "provider_not_available",
-                            module=module_name,
-                            reason=str(e),
-                        )
-                    except Exception as e:
-                        error_msg = f"{module_name}: {e}"
-                        errors.append(error_msg)
-                        logger.error(
-                            "provider_load_error", module=module_name, error=str(e)
-                        )
-
-            except ImportError as e:
-                logger.error("providers_package_not_found", error=str(e))
+            for module_name, packages in _PROVIDER_MODULES.items():
+                missing = [p for p in packages if find_spec(p) is None]
+                if missing:
+                    logger.debug(
+                        "provider_not_available",
+                        module=module_name,
+                        reason=f"missing packages: {', '.join(missing)}",
+                    )
+                    continue
+
+                try:
+                    import_module(f"{_PROVIDERS_PACKAGE}.{module_name}")
+                    logger.debug("provider_module_loaded", module=module_name)
+                except ImportError as e:
+                    logger.debug(
+                        "provider_not_available",
+                        module=module_name,
+                        reason=str(e),
+                    )
+                except Exception as e:
+                    error_msg = f"{module_name}: {e}"
+                    errors.append(error_msg)
+                    logger.error(
+                        "provider_load_error", module=module_name, error=str(e)
+                    )
 
             if errors:
                 logger.warning("providers_load_errors", errors=errors)
@@ -139,8 +149,38 @@ class ProviderRegistry:
             class_name=provider_class.__name__,
         )
         self._providers[provider_id] = provider_class
+        self._models_cache.clear()
         return provider_class
 
+    def _provider_models(
+        self,
+        provider_id: str,
+        provider_class: type[ProviderProtocol],
+        capability: ModelCapability | None,
+    ) -> tuple[ModelInfo, ...]:
+        """
+        Get a provider's models, optionally filtered by capability.
+
+        list_models() is static metadata, so it is called and filtered
+        once per (provider, capability) and then served from the cache.
+
+        Args:
+            provider_id: Provider identifier.
+            provider_class: The registered provider class.
+            capability: Optional capability to filter models by.
+
+        Returns:
+            The matching models.
+        """
+        key = (provider_id, capability)
+        models = self._models_cache.get(key)
+        if models is None:
+            models = tuple(provider_class.list_models())
+            if capability:
+                models = tuple(m for m in models if m.supports(capability))
+            self._models_cache[key] = models
+        return models
+
     def get_available_models(
         self,
         settings: Settings,
@@ -162,26 +202,21 @@ class ProviderRegistry:
         self._ensure_loaded()
 
         models: list[ModelInfo] = []
+        not_configured: list[str] = []
         for provider_id, provider_class in self._providers.items():
             if provider_class.is_available(settings):
-                provider_models = provider_class.list_models()
-
-                # Filter by capability if specified
-                if capability:
-                    provider_models = [
-                        m for m in provider_models if m.supports(capability)
-                    ]
-
-                models.extend(provider_models)
-                logger.debug(
-                    "provider_models_added",
-                    provider=provider_id,
-                    count=len(provider_models),
+                models.extend(
+                    self._provider_models(provider_id, provider_class, capability)
                 )
             else:
-                logger.debug("provider_not_configured", provider=provider_id)
+                not_configured.append(provider_id)
 
-        logger.info("available_models_fetched", total=len(models))
+        # One event per fetch rather than one per provider
+        logger.info(
+            "available_models_fetched",
+            total=len(models),
+            not_configured=not_configured,
+        )
         return models
 
     def create_client(self, model_id: str, settings: Settings) -> BaseLLMClient:
@@ -203,13 +238,13 @@ class ProviderRegistry:
         self._ensure_loaded()
 
         # Validate and parse model_id
-        parts = model_id.split("/", 1)
-        if len(parts) != 2 or not parts[0] or not parts[1] or parts[1].startswith("/"):
+        match = _MODEL_ID_RE.fullmatch(model_id)
+        if match is None:
             raise ValueError(
                 f"Invalid model ID format: '{model_id}'. Expected 'provider/model-name'"
             )
 
-        provider_id, model_name = parts
+        provider_id, model_name = match.groups()
 
         if provider_id not in self._providers:
             available = ", ".join(self._providers.keys())
@@ -258,10 +293,11 @@ class ProviderRegistry:
         Clear all registered providers.
 
         Used for testing to reset registry state.
-        Also resets the loaded flag.
+        Also resets the loaded flag and the model cache.
         """
         logger.debug("clearing_registry")
         self._providers.clear()
+        self._models_cache.clear()
         self._loaded = False
 
 
@@ -7,15 +7,17 @@ Implements the ConversationPartner port using LLM clients.
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
-from typing import TYPE_CHECKING
 
 from src.core.entities.message import Message, MessageRole
 from src.core.value_objects import ConversationTone
 from src.infrastructure.adapters.llm.clients.base import BaseLLMClient, LLMMessage
 from src.infrastructure.prompts import build_coach_system_prompt
 
-if TYPE_CHECKING:
-    pass
+# Domain role -> LLM API role
+_LLM_ROLES: dict[MessageRole, str] = {
+    MessageRole.USER: "user",
+    MessageRole.COACH: "assistant",
+}
 
 
 class LLMConversationPartner:
@@ -59,11 +61,10 @@ class LLMConversationPartner:
         """
         system_prompt = build_coach_system_prompt(context, tone)
         llm_messages = [LLMMessage(role="system", content=system_prompt)]
-
-        for msg in messages:
-            role = "assistant" if msg.role == MessageRole.COACH else "user"
-            llm_messages.append(LLMMessage(role=role, content=msg.content))
-
+        llm_messages += [
+            LLMMessage(role=_LLM_ROLES[msg.role], content=msg.content)
+            for msg in messages
+        ]
         return llm_messages
 
     async def generate_response(
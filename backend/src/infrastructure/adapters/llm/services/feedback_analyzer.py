@@ -7,17 +7,28 @@ Implements the FeedbackProvider port using LLM clients.
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, Any
+from collections.abc import Sequence
+from typing import Any
 
 from src.core.entities.feedback import Feedback
 from src.core.entities.message import Message
 from src.core.exceptions import FeedbackAnalysisError
 from src.core.value_objects import Correction, CorrectionType
 from src.infrastructure.adapters.llm.clients.base import BaseLLMClient, LLMMessage
-from src.infrastructure.prompts import FEEDBACK_SYSTEM_PROMPT, build_feedback_prompt
+from src.infrastructure.prompts import (
+    FEEDBACK_SYSTEM_PROMPT,
+    build_feedback_batch_prompt,
+    build_feedback_prompt,
+)
 
-if TYPE_CHECKING:
-    pass
+_CORRECTION_TYPES: dict[str, CorrectionType] = {
+    "grammar": CorrectionType.GRAMMAR,
+    "vocabulary": CorrectionType.VOCABULARY,
+    "phrasing": CorrectionType.PHRASING,
+}
+
+# LLMMessage is frozen, so one instance is shared by every request
+_SYSTEM_MESSAGE = LLMMessage(role="system", content=FEEDBACK_SYSTEM_PROMPT)
 
 
 class LLMFeedbackAnalyzer:
@@ -57,9 +68,66 @@ class LLMFeedbackAnalyzer:
         Raises:
             FeedbackAnalysisError: If analysis fails.
         """
+        data = await self._complete_json(build_feedback_prompt(message.content))
+
+        try:
+            return self._parse_feedback(data)
+        except Exception as exc:
+            raise FeedbackAnalysisError(f"Feedback analysis failed: {exc}") from exc
+
+    async def analyze_messages(self, messages: Sequence[Message]) -> list[Feedback]:
+        """
+        Analyze several messages with a single LLM call.
+
+        The system prompt and round trip are shared by the whole batch.
+        A single message uses the regular per-message prompt. Adapter-only:
+        not part of the FeedbackProvider port until a use case needs it.
+
+        Args:
+            messages: The user messages to analyze.
+
+        Returns:
+            One Feedback per message, in input order.
+
+        Raises:
+            FeedbackAnalysisError: If analysis fails or the response does not
+                hold exactly one result per message.
+        """
+        if not messages:
+            return []
+        if len(messages) == 1:
+            return [await self.analyze_message(messages[0])]
+
+        data = await self._complete_json(
+            build_feedback_batch_prompt([m.content for m in messages])
+        )
+        results = data.get("results") if isinstance(data, dict) else None
+        if not isinstance(results, list) or len(results) != len(messages):
+            raise FeedbackAnalysisError(
+                f"Expected {len(messages)} results in batch feedback response"
+            )
+
+        try:
+            return [self._parse_feedback(result) for result in results]
+        except Exception as exc:
+            raise FeedbackAnalysisError(f"Feedback analysis failed: {exc}") from exc
+
+    async def _complete_json(self, prompt: str) -> Any:
+        """
+        Send a feedback prompt in JSON mode and decode the reply.
+
+        Args:
+            prompt: The user prompt to send after the system prompt.
+
+        Returns:
+            The decoded JSON document.
+
+        Raises:
+            FeedbackAnalysisError: If the call fails or the reply is not JSON.
+        """
         messages = [
-            LLMMessage(role="system", content=FEEDBACK_SYSTEM_PROMPT),
-            LLMMessage(role="user", content=build_feedback_prompt(message.content)),
+            _SYSTEM_MESSAGE,
+            LLMMessage(role="user", content=prompt),
         ]
 
         try:
@@ -68,17 +136,13 @@ class LLMFeedbackAnalyzer:
                 temperature=0.3,  # Lower temperature for consistent analysis
                 json_mode=True,
             )
+        except Exception as exc:
+            raise FeedbackAnalysisError(f"Feedback analysis failed: {exc}") from exc
 
-            # Parse JSON response
-            try:
-                data = json.loads(response.content)
-            except json.JSONDecodeError as e:
-                raise FeedbackAnalysisError(f"Invalid JSON response: {e}") from e
-
-            return self._parse_feedback(data)
-
-        except FeedbackAnalysisError:
-            raise
+        try:
+            return json.loads(response.content)
+        except json.JSONDecodeError as e:
+            raise FeedbackAnalysisError(f"Invalid JSON response: {e}") from e
         except Exception as exc:
             raise FeedbackAnalysisError(f"Feedback analysis failed: {exc}") from exc
 
@@ -104,11 +168,8 @@ class LLMFeedbackAnalyzer:
                 )
             )
 
-        suggestions = (
-            list(data.get("suggestions", []))
-            if isinstance(data.get("suggestions", []), list)
-            else []
-        )
+        raw_suggestions = data.get("suggestions")
+        suggestions = list(raw_suggestions) if isinstance(raw_suggestions, list) else []
 
         return Feedback.create(corrections=corrections, suggestions=suggestions)
 
@@ -117,10 +178,8 @@ class LLMFeedbackAnalyzer:
         if not isinstance(correction_type, str):
             return None
 
-        type_lower = correction_type.lower().strip()
-        mapping = {
-            "grammar": CorrectionType.GRAMMAR,
-            "vocabulary": CorrectionType.VOCABULARY,
-            "phrasing": CorrectionType.PHRASING,
-        }
-        return mapping.get(type_lower)
+        # Fast path: the prompt asks for exact lowercase values
+        normalized = _CORRECTION_TYPES.get(correction_type)
+        if normalized is not None:
+            return normalized
+        return _CORRECTION_TYPES.get(correction_type.lower().strip())
@@ -7,7 +7,7 @@ Implements the SummaryProvider port using LLM clients.
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 from src.core.entities.conversation import Conversation
 from src.core.entities.conversation_summary import ConversationSummary
@@ -15,10 +15,6 @@ from src.core.entities.message import MessageRole
 from src.core.exceptions import SummaryGenerationError
 from src.infrastructure.adapters.llm.clients.base import BaseLLMClient, LLMMessage
 
-if TYPE_CHECKING:
-    pass
-
-
 SUMMARY_SYSTEM_PROMPT = """You are a language learning coach reviewing a conversation session.
 Analyze the user's messages and provide constructive feedback on their language skills.
 
@@ -36,17 +32,20 @@ Be encouraging but honest. Focus on:
 - Natural expression
 - Communication effectiveness"""
 
+# LLMMessage is frozen, so one instance is shared by every request
+_SYSTEM_MESSAGE = LLMMessage(role="system", content=SUMMARY_SYSTEM_PROMPT)
+
 
 def _build_summary_prompt(conversation: Conversation) -> str:
     """Build the summary analysis prompt with conversation content."""
-    user_messages = [
-        msg.content for msg in conversation.messages if msg.role == MessageRole.USER
-    ]
+    user = MessageRole.USER
+    user_messages = [msg.content for msg in conversation.messages if msg.role is user]
 
     if not user_messages:
         return "No user messages to analyze."
 
-    messages_text = "\n".join(f"- {msg}" for msg in user_messages)
+    # One join builds the bullet list without a per-message f-string
+    messages_text = "- " + "\n- ".join(user_messages)
 
     return f"""Please analyze the following user messages from a language learning conversation:
 
@@ -96,7 +95,7 @@ class LLMSummaryGenerator:
             SummaryGenerationError: If summary generation fails.
         """
         messages = [
-            LLMMessage(role="system", content=SUMMARY_SYSTEM_PROMPT),
+            _SYSTEM_MESSAGE,
             LLMMessage(role="user", content=_build_summary_prompt(conversation)),
         ]
 
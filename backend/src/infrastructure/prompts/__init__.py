@@ -10,7 +10,9 @@ from src.infrastructure.prompts.coach_prompts import (
 )
 from src.infrastructure.prompts.feedback_prompts import (
     FEEDBACK_ANALYSIS_PROMPT,
+    FEEDBACK_BATCH_ANALYSIS_PROMPT,
     FEEDBACK_SYSTEM_PROMPT,
+    build_feedback_batch_prompt,
     build_feedback_prompt,
 )
 
@@ -18,6 +20,8 @@ __all__ = [
     "TONE_PROMPTS",
     "build_coach_system_prompt",
     "FEEDBACK_ANALYSIS_PROMPT",
+    "FEEDBACK_BATCH_ANALYSIS_PROMPT",
     "FEEDBACK_SYSTEM_PROMPT",
+    "build_feedback_batch_prompt",
     "build_feedback_prompt",
 ]
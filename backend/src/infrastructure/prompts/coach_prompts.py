@@ -4,31 +4,36 @@ Coach system prompts for conversation partners.
 Contains tone-specific prompts and system prompt builder.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from src.core.value_objects import ConversationTone
 
-TONE_PROMPTS: dict[ConversationTone, str] = {
-    ConversationTone.FORMAL: """
+# Read-only: the per-tone prompt prefixes below are derived from it at import
+TONE_PROMPTS: Mapping[ConversationTone, str] = MappingProxyType(
+    {
+        ConversationTone.FORMAL: """
 You are a formal and precise language coach.
 Use polite, professional language appropriate for business contexts.
 Avoid slang, contractions, and casual expressions.
 Focus on accuracy, proper grammar, and etiquette.
 Provide detailed explanations when correcting errors.
     """.strip(),
-    ConversationTone.FRIENDLY: """
+        ConversationTone.FRIENDLY: """
 You are a friendly and warm language coach.
 Use casual, relaxed language to make the learner feel comfortable.
 Include light humor when appropriate and be supportive.
 Create a safe space for making mistakes and learning.
 Celebrate small wins and progress.
     """.strip(),
-    ConversationTone.ENCOURAGING: """
+        ConversationTone.ENCOURAGING: """
 You are an enthusiastic and motivating language coach!
 Celebrate every attempt the learner makes.
 Use positive reinforcement and encouraging words frequently.
 Focus on what the learner did well before suggesting improvements.
 Keep energy high and make learning feel exciting and achievable.
     """.strip(),
-    ConversationTone.PATIENT: """
+        ConversationTone.PATIENT: """
 You are a patient and gentle language coach.
 Take things slowly and explain concepts step by step.
 Never rush the learner or show frustration.
@@ -36,6 +41,25 @@ Repeat explanations in different ways if needed.
 Perfect for beginners who need extra support and time.
 Use simple vocabulary and short sentences.
     """.strip(),
+    }
+)
+
+
+def _prompt_prefix(tone_prompt: str) -> str:
+    """Render the system prompt up to (not including) the context text."""
+    return f"""You are a language learning coach having a conversation.
+
+IMPORTANT: Do NOT correct the user's grammar, vocabulary, or phrasing during the conversation.
+Just have a natural conversation about the topic. Corrections are handled separately.
+
+{tone_prompt}
+
+Context: """
+
+
+# Everything but the context is fixed per tone, so it is rendered once here
+_PROMPT_PREFIX_BY_TONE: dict[ConversationTone, str] = {
+    tone: _prompt_prefix(tone_prompt) for tone, tone_prompt in TONE_PROMPTS.items()
 }
 
 
@@ -54,13 +78,4 @@ def build_coach_system_prompt(
         The complete system prompt string.
     """
     effective_tone = tone if tone is not None else ConversationTone.FRIENDLY
-    tone_prompt = TONE_PROMPTS[effective_tone]
-
-    return f"""You are a language learning coach having a conversation.
-
-IMPORTANT: Do NOT correct the user's grammar, vocabulary, or phrasing during the conversation.
-Just have a natural conversation about the topic. Corrections are handled separately.
-
-{tone_prompt}
-
-Context: {context}"""
+    return _PROMPT_PREFIX_BY_TONE[effective_tone] + context
@@ -4,23 +4,21 @@ Feedback analysis prompts for feedback providers.
 Contains prompts for language error analysis.
 """
 
+import textwrap
+from collections.abc import Sequence
+
 FEEDBACK_SYSTEM_PROMPT = (
     "You are a language tutor analyzing student messages. Always respond in valid JSON."
 )
 
 
-FEEDBACK_ANALYSIS_PROMPT = """
-You are a language tutor analyzing a student's message for errors.
-
-Message: "<<MESSAGE>>"
-
-Carefully analyze this message and identify ONLY actual errors in:
+# Shared by the single and batch prompts so their rules cannot drift apart
+_ERROR_CATEGORIES = """identify ONLY actual errors in:
 - Grammar (verb tenses, subject-verb agreement, word order, articles, etc.)
 - Vocabulary (wrong word choice, inappropriate word for context)
-- Phrasing (awkward or unnatural expressions)
+- Phrasing (awkward or unnatural expressions)"""
 
-Respond **ONLY** in valid JSON format (no markdown, no extra text):
-{
+_FEEDBACK_JSON = """{
   "corrections": [
     {
       "original": "the exact incorrect phrase from the message",
@@ -30,15 +28,45 @@ Respond **ONLY** in valid JSON format (no markdown, no extra text):
     }
   ],
   "suggestions": ["optional tips for improvement"]
-}
+}"""
+
+_CORRECTION_RULES = (
+    "Only report REAL errors - don't correct things that are already correct",
+    '"type" must be exactly one of: "grammar", "vocabulary", or "phrasing"',
+    '"original" must be the EXACT text from the message',
+    "Keep explanations short and helpful",
+    "Do NOT invent errors where there are none",
+)
+
+
+def _numbered_rules(*rules: str) -> str:
+    """Render rules as a numbered list, one per line."""
+    return "\n".join(f"{i}. {rule}" for i, rule in enumerate(rules, 1))
+
+
+_SINGLE_RULES = _numbered_rules(
+    'If the message has NO errors, return: {"corrections": [], "suggestions": []}',
+    *_CORRECTION_RULES,
+)
+_BATCH_RULES = _numbered_rules(
+    '"results" must contain exactly one entry per message, in the same order',
+    'If a message has NO errors, its entry is: {"corrections": [], "suggestions": []}',
+    *_CORRECTION_RULES,
+)
+
+
+FEEDBACK_ANALYSIS_PROMPT = f"""
+You are a language tutor analyzing a student's message for errors.
+
+Message: "<<MESSAGE>>"
+
+Carefully analyze this message and {_ERROR_CATEGORIES}
+
+Respond **ONLY** in valid JSON format (no markdown, no extra text):
+{_FEEDBACK_JSON}
 
 IMPORTANT RULES:
-1. If the message has NO errors, return: {"corrections": [], "suggestions": []}
-2. Only report REAL errors - don't correct things that are already correct
-3. "type" must be exactly one of: "grammar", "vocabulary", or "phrasing"
-4. "original" must be the EXACT text from the message
-5. Keep explanations short and helpful
-6. Do NOT invent errors where there are none
+{_SINGLE_RULES}
 
 Examples:
 - Message: "I go to school yesterday" → Correction needed (went, not go)
@@ -46,6 +74,29 @@ Examples:
 - Message: "He don't like it" → Correction needed (doesn't, not don't)
 """
 
+FEEDBACK_BATCH_ANALYSIS_PROMPT = f"""
+You are a language tutor analyzing several student messages for errors.
+Analyze each message independently.
+
+<<MESSAGES>>
+
+For EACH message, {_ERROR_CATEGORIES}
+
+Respond **ONLY** in valid JSON format (no markdown, no extra text):
+{{
+  "results": [
+{textwrap.indent(_FEEDBACK_JSON, "    ")}
+  ]
+}}
+
+IMPORTANT RULES:
+{_BATCH_RULES}
+"""
+
+# Split once at import so each build is a single concatenation
+_PROMPT_PREFIX, _PROMPT_SUFFIX = FEEDBACK_ANALYSIS_PROMPT.split("<<MESSAGE>>", 1)
+_BATCH_PREFIX, _BATCH_SUFFIX = FEEDBACK_BATCH_ANALYSIS_PROMPT.split("<<MESSAGES>>", 1)
+
 
 def build_feedback_prompt(message_content: str) -> str:
     """
@@ -57,4 +108,20 @@ def build_feedback_prompt(message_content: str) -> str:
     Returns:
         The complete feedback prompt string.
     """
-    return FEEDBACK_ANALYSIS_PROMPT.replace("<<MESSAGE>>", message_content)
+    return f"{_PROMPT_PREFIX}{message_content}{_PROMPT_SUFFIX}"
+
+
+def build_feedback_batch_prompt(message_contents: Sequence[str]) -> str:
+    """
+    Build one feedback analysis prompt covering several messages.
+
+    Args:
+        message_contents: The user messages to analyze, in order.
+
+    Returns:
+        The complete batch feedback prompt string.
+    """
+    numbered = "\n".join(
+        f'Message {i}: "{content}"' for i, content in enumerate(message_contents, 1)
+    )
+    return f"{_BATCH_PREFIX}{numbered}{_BATCH_SUFFIX}"
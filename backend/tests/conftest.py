@@ -5,7 +5,7 @@ Centralized fixtures for all test suites.
 """
 
 import os
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -58,12 +58,21 @@ def mock_summary_provider() -> AsyncMock:
     return AsyncMock()
 
 
+@pytest.fixture
+def mock_feedback_metrics() -> MagicMock:
+    """Create mock FeedbackMetrics."""
+    return MagicMock()
+
+
 # =============================================================================
 # DOMAIN VALUE OBJECTS
 # =============================================================================
+# Scope rule: only immutable objects (frozen value objects) may be shared
+# beyond a single test. Entities are mutated by tests (rate, attach_feedback,
+# archive, end...) and stay function-scoped, as do lists that hold VOs.
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_correction() -> Correction:
     """Reusable correction for tests."""
     return Correction(
@@ -23,7 +23,7 @@ class TestArchive:
         conversation: Conversation,
     ) -> None:
         """archive() sets status to archived."""
-        mock_repository.get = AsyncMock(return_value=conversation)
+        mock_repository.get.return_value = conversation
 
         use_case = ChangeConversationStatus(repository=mock_repository)
         result = await use_case.archive(conversation.id)
@@ -32,21 +32,6 @@ class TestArchive:
         assert conversation.is_archived
         mock_repository.save.assert_called_once_with(conversation)
 
-    async def test_raises_when_not_found(
-        self,
-        mock_repository: AsyncMock,
-    ) -> None:
-        """archive() raises ConversationNotFoundError for missing conversation."""
-        fake_id = uuid4()
-        mock_repository.get = AsyncMock(
-            side_effect=ConversationNotFoundError(f"Conversation {fake_id} not found")
-        )
-
-        use_case = ChangeConversationStatus(repository=mock_repository)
-
-        with pytest.raises(ConversationNotFoundError):
-            await use_case.archive(fake_id)
-
     async def test_raises_when_already_archived(
         self,
         mock_repository: AsyncMock,
@@ -54,7 +39,7 @@ class TestArchive:
     ) -> None:
         """archive() raises InvalidConversationStateError for archived conversation."""
         conversation.archive()  # Already archived
-        mock_repository.get = AsyncMock(return_value=conversation)
+        mock_repository.get.return_value = conversation
 
         use_case = ChangeConversationStatus(repository=mock_repository)
 
@@ -68,7 +53,7 @@ class TestArchive:
     ) -> None:
         """archive() raises InvalidConversationStateError for completed conversation."""
         conversation.end()  # Completed
-        mock_repository.get = AsyncMock(return_value=conversation)
+        mock_repository.get.return_value = conversation
 
         use_case = ChangeConversationStatus(repository=mock_repository)
 
@@ -86,7 +71,7 @@ class TestRestore:
     ) -> None:
         """restore() sets status back to active."""
         conversation.archive()  # First archive it
-        mock_repository.get = AsyncMock(return_value=conversation)
+        mock_repository.get.return_value = conversation
 
         use_case = ChangeConversationStatus(repository=mock_repository)
         result = await use_case.restore(conversation.id)
@@ -95,21 +80,6 @@ class TestRestore:
         assert conversation.is_active
         mock_repository.save.assert_called_once_with(conversation)
 
-    async def test_raises_when_not_found(
-        self,
-        mock_repository: AsyncMock,
-    ) -> None:
-        """restore() raises ConversationNotFoundError for missing conversation."""
-        fake_id = uuid4()
-        mock_repository.get = AsyncMock(
-            side_effect=ConversationNotFoundError(f"Conversation {fake_id} not found")
-        )
-
-        use_case = ChangeConversationStatus(repository=mock_repository)
-
-        with pytest.raises(ConversationNotFoundError):
-            await use_case.restore(fake_id)
-
     async def test_raises_when_already_active(
         self,
         mock_repository: AsyncMock,
@@ -117,7 +87,7 @@ class TestRestore:
     ) -> None:
         """restore() raises InvalidConversationStateError for active conversation."""
         # conversation is already active by default
-        mock_repository.get = AsyncMock(return_value=conversation)
+        mock_repository.get.return_value = conversation
 
         use_case = ChangeConversationStatus(repository=mock_repository)
 
@@ -134,7 +104,7 @@ class TestEnd:
         conversation: Conversation,
     ) -> None:
         """end() sets status to completed."""
-        mock_repository.get = AsyncMock(return_value=conversation)
+        mock_repository.get.return_value = conversation
 
         use_case = ChangeConversationStatus(repository=mock_repository)
         result = await use_case.end(conversation.id)
@@ -143,21 +113,6 @@ class TestEnd:
         assert conversation.is_completed
         mock_repository.save.assert_called_once_with(conversation)
 
-    async def test_raises_when_not_found(
-        self,
-        mock_repository: AsyncMock,
-    ) -> None:
-        """end() raises ConversationNotFoundError for missing conversation."""
-        fake_id = uuid4()
-        mock_repository.get = AsyncMock(
-            side_effect=ConversationNotFoundError(f"Conversation {fake_id} not found")
-        )
-
-        use_case = ChangeConversationStatus(repository=mock_repository)
-
-        with pytest.raises(ConversationNotFoundError):
-            await use_case.end(fake_id)
-
 
 class TestDelete:
     """Tests for ChangeConversationStatus.delete()."""
@@ -168,25 +123,27 @@ class TestDelete:
         conversation: Conversation,
     ) -> None:
         """delete() calls repository.delete and returns True."""
-        mock_repository.delete = AsyncMock()
-
         use_case = ChangeConversationStatus(repository=mock_repository)
         result = await use_case.delete(conversation.id)
 
         assert result is True
         mock_repository.delete.assert_called_once_with(conversation.id)
 
-    async def test_delete_propagates_not_found(
-        self,
-        mock_repository: AsyncMock,
-    ) -> None:
-        """delete() propagates ConversationNotFoundError from repository."""
-        fake_id = uuid4()
-        mock_repository.delete = AsyncMock(
-            side_effect=ConversationNotFoundError(f"Conversation {fake_id} not found")
-        )
 
-        use_case = ChangeConversationStatus(repository=mock_repository)
+@pytest.mark.parametrize("method_name", ["archive", "restore", "end", "delete"])
+async def test_raises_when_not_found(
+    mock_repository: AsyncMock,
+    method_name: str,
+) -> None:
+    """Every lifecycle operation propagates ConversationNotFoundError."""
+    fake_id = uuid4()
+    # delete() goes straight to the repository; the others load first
+    repository_method = "delete" if method_name == "delete" else "get"
+    getattr(mock_repository, repository_method).side_effect = ConversationNotFoundError(
+        f"Conversation {fake_id} not found"
+    )
+
+    use_case = ChangeConversationStatus(repository=mock_repository)
 
-        with pytest.raises(ConversationNotFoundError):
-            await use_case.delete(fake_id)
+    with pytest.raises(ConversationNotFoundError):
+        await getattr(use_case, method_name)(fake_id)
@@ -11,6 +11,7 @@ import pytest
 from src.application.dtos.use_case_dtos import CreateConversationInput
 from src.application.use_cases.create_conversation import CreateConversation
 from src.core.exceptions import InvalidContextError
+from src.core.value_objects import ConversationTone
 
 
 class TestCreateConversation:
@@ -53,3 +54,25 @@ class TestCreateConversation:
         )
         with pytest.raises(InvalidContextError):
             await use_case.execute(input_dto)
+
+    async def test_maps_tone_string_to_enum(
+        self, use_case: CreateConversation, mock_repository: AsyncMock
+    ) -> None:
+        """Verify the tone string is mapped to the domain enum before saving."""
+        await use_case.execute(
+            CreateConversationInput(context_topic="meeting", tone="formal")
+        )
+
+        saved = mock_repository.save.call_args[0][0]
+        assert saved.tone is ConversationTone.FORMAL
+
+    async def test_raises_error_for_invalid_tone(
+        self, use_case: CreateConversation, mock_repository: AsyncMock
+    ) -> None:
+        """Verify unknown tone values raise ValueError and nothing is saved."""
+        input_dto = CreateConversationInput(context_topic="coffee shop", tone="rude")
+
+        with pytest.raises(ValueError):
+            await use_case.execute(input_dto)
+
+        mock_repository.save.assert_not_called()
@@ -35,7 +35,7 @@ class TestRequestFeedback:
         """request() raises for COACH messages."""
         conv = Conversation.create(context_topic="coffee_shop")
         coach_msg = conv.add_message("Hello! How can I help?", MessageRole.COACH)
-        mock_repository.get_by_message_id.return_value = conv
+        mock_repository.get_message_by_id.return_value = coach_msg
         mock_feedback_provider.analyze_message.return_value = sample_feedback
 
         use_case = FeedbackUseCases(
@@ -45,6 +45,8 @@ class TestRequestFeedback:
         with pytest.raises(InvalidMessageContentError, match="Only user messages"):
             await use_case.request(RequestFeedbackInput(message_id=coach_msg.id))
 
+        mock_feedback_provider.analyze_message.assert_not_called()
+
     async def test_returns_feedback(
         self,
         mock_repository: AsyncMock,
@@ -55,7 +57,7 @@ class TestRequestFeedback:
     ) -> None:
         """request() returns feedback from provider."""
         conv, msg = sample_conversation_with_message
-        mock_repository.get_by_message_id.return_value = conv
+        mock_repository.get_message_by_id.return_value = msg
         mock_feedback_provider.analyze_message.return_value = sample_feedback
 
         use_case = FeedbackUseCases(
@@ -64,7 +66,7 @@ class TestRequestFeedback:
         result = await use_case.request(RequestFeedbackInput(message_id=msg.id))
 
         assert result == FeedbackMapper.to_output(sample_feedback)
-        mock_repository.get_by_message_id.assert_called_once_with(msg.id)
+        mock_repository.get_message_by_id.assert_called_once_with(msg.id)
         mock_feedback_provider.analyze_message.assert_called_once_with(msg)
 
     async def test_attaches_feedback_to_message(
@@ -77,7 +79,7 @@ class TestRequestFeedback:
     ) -> None:
         """request() attaches feedback to the message."""
         conv, msg = sample_conversation_with_message
-        mock_repository.get_by_message_id.return_value = conv
+        mock_repository.get_message_by_id.return_value = msg
         mock_feedback_provider.analyze_message.return_value = sample_feedback
 
         use_case = FeedbackUseCases(
@@ -88,7 +90,7 @@ class TestRequestFeedback:
         # Verify feedback was attached to the message
         assert msg.feedback == sample_feedback
 
-    async def test_saves_conversation(
+    async def test_updates_message_only(
         self,
         mock_repository: AsyncMock,
         mock_feedback_provider: AsyncMock,
@@ -96,9 +98,9 @@ class TestRequestFeedback:
         sample_feedback: Feedback,
         sample_conversation_with_message: tuple[Conversation, Message],
     ) -> None:
-        """request() persists the updated conversation."""
+        """request() persists only the message, never the conversation."""
         conv, msg = sample_conversation_with_message
-        mock_repository.get_by_message_id.return_value = conv
+        mock_repository.get_message_by_id.return_value = msg
         mock_feedback_provider.analyze_message.return_value = sample_feedback
 
         use_case = FeedbackUseCases(
@@ -106,7 +108,8 @@ class TestRequestFeedback:
         )
         await use_case.request(RequestFeedbackInput(message_id=msg.id))
 
-        mock_repository.save.assert_called_once_with(conv)
+        mock_repository.update_message.assert_called_once_with(msg)
+        mock_repository.save.assert_not_called()
 
     async def test_raises_when_message_not_found(
         self,
@@ -115,7 +118,7 @@ class TestRequestFeedback:
         mock_feedback_metrics: MagicMock,
     ) -> None:
         """request() raises MessageNotFoundError when message not in repo."""
-        mock_repository.get_by_message_id.side_effect = MessageNotFoundError(
+        mock_repository.get_message_by_id.side_effect = MessageNotFoundError(
             "Message not found"
         )
 
@@ -139,7 +142,7 @@ class TestRequestFeedback:
         # Attach initial feedback
         msg.attach_feedback(sample_feedback)
 
-        mock_repository.get_by_message_id.return_value = conv
+        mock_repository.get_message_by_id.return_value = msg
         # Provider returns new feedback
         new_feedback = Feedback.create(corrections=[], suggestions=["New suggestion"])
         mock_feedback_provider.analyze_message.return_value = new_feedback
@@ -151,6 +154,9 @@ class TestRequestFeedback:
         with pytest.raises(InvalidMessageContentError, match="already has feedback"):
             await use_case.request(RequestFeedbackInput(message_id=msg.id))
 
+        mock_feedback_provider.analyze_message.assert_not_called()
+        mock_repository.update_message.assert_not_called()
+
 
 class TestRateFeedback:
     """Tests for FeedbackUseCases.rate()."""
@@ -164,7 +170,7 @@ class TestRateFeedback:
     ) -> None:
         """rate() updates rating if called multiple times."""
         conv, msg = sample_conversation_with_feedback
-        mock_repository.get_by_message_id.return_value = conv
+        mock_repository.get_message_by_id.return_value = msg
 
         use_case = FeedbackUseCases(
             mock_repository, mock_feedback_provider, mock_feedback_metrics
@@ -182,7 +188,7 @@ class TestRateFeedback:
         assert result1.user_comment == "Not helpful"
         assert msg.feedback.user_rating is False
         assert msg.feedback.user_comment == "Not helpful"
-        mock_repository.save.assert_called_with(conv)
+        mock_repository.update_message.assert_called_with(msg)
 
         # 2. Update to positive rating (should verify comment is cleared by entity logic)
         input2 = RateFeedbackInput(
@@ -197,8 +203,28 @@ class TestRateFeedback:
         assert msg.feedback.user_rating is True
         assert msg.feedback.user_comment is None
 
-        # Verify save called again
-        assert mock_repository.save.call_count == 2
+        # Verify message updated again, conversation never rewritten
+        assert mock_repository.update_message.call_count == 2
+        mock_repository.save.assert_not_called()
+
+    async def test_records_rating_metrics(
+        self,
+        mock_repository: AsyncMock,
+        mock_feedback_provider: AsyncMock,
+        mock_feedback_metrics: MagicMock,
+        sample_conversation_with_feedback: tuple[Conversation, Message],
+    ) -> None:
+        """rate() records the rating and satisfaction score."""
+        conv, msg = sample_conversation_with_feedback
+        mock_repository.get_message_by_id.return_value = msg
+
+        use_case = FeedbackUseCases(
+            mock_repository, mock_feedback_provider, mock_feedback_metrics
+        )
+        await use_case.rate(RateFeedbackInput(message_id=msg.id, rating=True))
+
+        mock_feedback_metrics.record_rating.assert_called_once_with(helpful=True)
+        mock_feedback_metrics.record_satisfaction.assert_called_once_with(1.0)
 
     async def test_raises_if_feedback_not_found(
         self,
@@ -211,7 +237,7 @@ class TestRateFeedback:
         msg = conv.add_message("test", MessageRole.USER)
         # No feedback attached
 
-        mock_repository.get_by_message_id.return_value = conv
+        mock_repository.get_message_by_id.return_value = msg
 
         use_case = FeedbackUseCases(
             mock_repository, mock_feedback_provider, mock_feedback_metrics
@@ -220,3 +246,6 @@ class TestRateFeedback:
 
         with pytest.raises(FeedbackNotFoundError):
             await use_case.rate(input_dto)
+
+        mock_feedback_metrics.record_rating.assert_not_called()
+        mock_repository.update_message.assert_not_called()
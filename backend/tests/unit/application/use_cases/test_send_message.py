@@ -4,7 +4,8 @@ Tests for SendMessage use case.
 Tests orchestration behavior with mocked dependencies.
 """
 
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, call
 from uuid import uuid4
 
 import pytest
@@ -12,7 +13,7 @@ import pytest
 from src.application.dtos.use_case_dtos import SendMessageInput, SendMessageOutput
 from src.application.use_cases.send_message import SendMessage
 from src.core.entities.conversation import Conversation
-from src.core.entities.message import MessageRole
+from src.core.entities.message import Message, MessageRole
 from src.core.exceptions import ConversationNotFoundError, InvalidConversationStateError
 
 
@@ -68,6 +69,8 @@ class TestSendMessage:
         assert result.user_message.role == MessageRole.USER.value
         assert result.coach_message.content == "Coach response"
         assert result.coach_message.role == MessageRole.COACH.value
+        # DTOs carry plain strings, not the domain enum
+        assert type(result.user_message.role) is str
 
     async def test_calls_partner_with_context_and_messages(
         self,
@@ -100,14 +103,14 @@ class TestSendMessage:
         assert context == "coffee shop"
         assert messages[0].content == "Bonjour"
 
-    async def test_saves_conversation_after_messages(
+    async def test_appends_both_messages_in_one_batch(
         self,
         use_case: SendMessage,
         mock_repository: AsyncMock,
         mock_partner: AsyncMock,
         conversation: Conversation,
     ) -> None:
-        """Verify conversation is saved with both messages."""
+        """Verify user and coach messages are persisted in a single batch."""
         mock_repository.get_active = AsyncMock(return_value=conversation)
 
         await use_case.execute(
@@ -117,9 +120,66 @@ class TestSendMessage:
             )
         )
 
-        mock_repository.save.assert_called_once_with(conversation)
+        mock_repository.append_messages.assert_awaited_once_with(
+            conversation.id, conversation.messages
+        )
+        mock_repository.save.assert_not_called()
         assert len(conversation.messages) == 2
 
+    async def test_cache_hit_skips_partner(
+        self,
+        mock_repository: AsyncMock,
+        mock_partner: AsyncMock,
+        conversation: Conversation,
+    ) -> None:
+        """Verify a cached response is used instead of calling the partner."""
+        mock_repository.get_active = AsyncMock(return_value=conversation)
+        cache = AsyncMock()
+        cache.get = AsyncMock(return_value="Cached response")
+        use_case = SendMessage(
+            repository=mock_repository, partner=mock_partner, cache=cache
+        )
+
+        result = await use_case.execute(
+            SendMessageInput(conversation_id=conversation.id, content="Bonjour")
+        )
+
+        assert result.coach_message.content == "Cached response"
+        mock_partner.generate_response.assert_not_called()
+        cache.put.assert_not_called()
+
+    async def test_cache_miss_stores_partner_response(
+        self,
+        mock_repository: AsyncMock,
+        mock_partner: AsyncMock,
+        conversation: Conversation,
+    ) -> None:
+        """Verify a generated response is stored under the lookup key."""
+        mock_repository.get_active = AsyncMock(return_value=conversation)
+        cache = AsyncMock()
+        cache.get = AsyncMock(return_value=None)
+        use_case = SendMessage(
+            repository=mock_repository, partner=mock_partner, cache=cache
+        )
+
+        await use_case.execute(
+            SendMessageInput(conversation_id=conversation.id, content="Bonjour")
+        )
+
+        mock_partner.generate_response.assert_awaited_once()
+        key = cache.get.await_args.args[0]
+        cache.put.assert_awaited_once_with(key, "Coach response")
+
+    def test_cache_key_depends_on_recent_messages(
+        self, conversation: Conversation
+    ) -> None:
+        """Verify different message histories produce different keys."""
+        other = Conversation.create(context_topic="coffee shop")
+        conversation.add_message("Bonjour", MessageRole.USER)
+        other.add_message("Salut", MessageRole.USER)
+
+        assert SendMessage._cache_key(conversation) != SendMessage._cache_key(other)
+
     async def test_raises_error_when_conversation_not_found(
         self,
         use_case: SendMessage,
@@ -264,37 +324,67 @@ class TestSendMessage:
             SendMessageInput(
                 conversation_id=conversation.id,
                 content="Test message",
-            )
+            ),
+            flush_every_n_tokens=1,
         ):
             tokens.append(token)
 
         assert tokens == ["Hello", " ", "World"]
 
-    async def test_execute_stream_saves_user_message_before_streaming(
+    async def test_execute_stream_coalesces_tokens(
         self,
         mock_repository: AsyncMock,
         conversation: Conversation,
     ) -> None:
-        """Verify user message is added and persisted before streaming starts."""
-        save_call_count = 0
+        """Verify tokens are grouped into chunks of at most N tokens."""
+        async def mock_stream(*args, **kwargs):
+            for token in "abcdefghij":
+                yield token
+
+        mock_partner = AsyncMock()
+        mock_partner.generate_response_stream = mock_stream
+
+        use_case = SendMessage(repository=mock_repository, partner=mock_partner)
+        mock_repository.get_active = AsyncMock(return_value=conversation)
+
+        chunks = [
+            chunk
+            async for chunk in use_case.execute_stream(
+                SendMessageInput(conversation_id=conversation.id, content="Hi"),
+                flush_every_n_tokens=4,
+                flush_every_ms=60_000,
+            )
+        ]
+
+        assert chunks == ["abcd", "efgh", "ij"]
+        assert conversation.messages[-1].content == "abcdefghij"
+
+    async def test_execute_stream_overlaps_user_save_with_stream(
+        self,
+        mock_repository: AsyncMock,
+        conversation: Conversation,
+    ) -> None:
+        """Verify streaming starts without waiting for the user message write."""
+        stream_started = asyncio.Event()
+        appended: list[Message] = []
 
         async def mock_stream(*args, **kwargs):
-            # Check user message was added and saved when streaming starts
-            nonlocal save_call_count
-            assert len(conversation.messages) >= 1
-            assert save_call_count >= 1  # save called before streaming
+            # User message is already part of the history sent to the partner
+            assert conversation.messages[0].content == "User message"
+            stream_started.set()
             yield "token"
 
+        async def append_after_stream_starts(conversation_id, message):
+            # Only completes once streaming has begun
+            await asyncio.wait_for(stream_started.wait(), timeout=1)
+            appended.append(message)
+
         mock_partner = AsyncMock()
         mock_partner.generate_response_stream = mock_stream
 
-        async def track_save(conv):
-            nonlocal save_call_count
-            save_call_count += 1
-
         use_case = SendMessage(repository=mock_repository, partner=mock_partner)
         mock_repository.get_active = AsyncMock(return_value=conversation)
-        mock_repository.save = track_save
+        mock_repository.append_message = append_after_stream_starts
 
         async for _ in use_case.execute_stream(
             SendMessageInput(
@@ -304,7 +394,7 @@ class TestSendMessage:
         ):
             pass
 
-        assert conversation.messages[0].content == "User message"
+        assert [m.content for m in appended] == ["User message", "token"]
 
     async def test_execute_stream_persists_coach_message_after_completion(
         self,
@@ -321,7 +411,7 @@ class TestSendMessage:
 
         use_case = SendMessage(repository=mock_repository, partner=mock_partner)
         mock_repository.get_active = AsyncMock(return_value=conversation)
-        mock_repository.save = AsyncMock(return_value=None)
+        mock_repository.append_message = AsyncMock(return_value=None)
 
         tokens: list[str] = []
         async for token in use_case.execute_stream(
@@ -336,8 +426,12 @@ class TestSendMessage:
         assert len(conversation.messages) == 2
         assert conversation.messages[1].content == "Hello World"
 
-        # Verify save was called twice (user message + coach message)
-        assert mock_repository.save.call_count == 2
+        # Verify each message was appended once, no full conversation save
+        assert mock_repository.append_message.await_args_list == [
+            call(conversation.id, conversation.messages[0]),
+            call(conversation.id, conversation.messages[1]),
+        ]
+        mock_repository.save.assert_not_called()
 
     async def test_execute_stream_does_not_save_coach_on_stream_error(
         self,
@@ -359,13 +453,13 @@ class TestSendMessage:
         mock_partner = AsyncMock()
         mock_partner.generate_response_stream = mock_stream_with_error
 
-        async def track_save(conv):
+        async def track_append(conversation_id, message):
             nonlocal save_call_count
             save_call_count += 1
 
         use_case = SendMessage(repository=mock_repository, partner=mock_partner)
         mock_repository.get_active = AsyncMock(return_value=conversation)
-        mock_repository.save = track_save
+        mock_repository.append_message = track_append
 
         tokens: list[str] = []
         with pytest.raises(RuntimeError, match="Stream interrupted"):
@@ -383,6 +477,87 @@ class TestSendMessage:
         assert conversation.messages[0].content == "User message"
         assert conversation.messages[0].role == MessageRole.USER
 
+    async def test_execute_stream_keeps_stream_error_when_save_fails(
+        self,
+        mock_repository: AsyncMock,
+        conversation: Conversation,
+    ) -> None:
+        """Verify a failed user save does not replace the stream error."""
+
+        async def mock_stream_with_error(*args, **kwargs):
+            yield "Hello"
+            raise RuntimeError("Stream interrupted")
+
+        mock_partner = AsyncMock()
+        mock_partner.generate_response_stream = mock_stream_with_error
+
+        use_case = SendMessage(repository=mock_repository, partner=mock_partner)
+        mock_repository.get_active.return_value = conversation
+        mock_repository.append_message.side_effect = OSError("Database down")
+
+        with pytest.raises(RuntimeError, match="Stream interrupted") as exc_info:
+            async for _ in use_case.execute_stream(
+                SendMessageInput(
+                    conversation_id=conversation.id,
+                    content="User message",
+                )
+            ):
+                pass
+
+        assert "Database down" in exc_info.value.__notes__[0]
+
+    async def test_execute_stream_close_not_masked_by_save_error(
+        self,
+        mock_repository: AsyncMock,
+        conversation: Conversation,
+    ) -> None:
+        """Verify a consumer closing the stream does not see the save error."""
+
+        async def mock_stream(*args, **kwargs):
+            yield "Hello"
+            yield " World"
+
+        mock_partner = AsyncMock()
+        mock_partner.generate_response_stream = mock_stream
+
+        use_case = SendMessage(repository=mock_repository, partner=mock_partner)
+        mock_repository.get_active.return_value = conversation
+        mock_repository.append_message.side_effect = OSError("Database down")
+
+        stream = use_case.execute_stream(
+            SendMessageInput(conversation_id=conversation.id, content="Hi"),
+            flush_every_n_tokens=1,
+        )
+        assert await anext(stream) == "Hello"
+
+        await stream.aclose()
+
+    async def test_execute_stream_raises_save_error_on_success(
+        self,
+        mock_repository: AsyncMock,
+        conversation: Conversation,
+    ) -> None:
+        """Verify a failed user save is raised when the stream succeeds."""
+
+        async def mock_stream(*args, **kwargs):
+            yield "Hello"
+
+        mock_partner = AsyncMock()
+        mock_partner.generate_response_stream = mock_stream
+
+        use_case = SendMessage(repository=mock_repository, partner=mock_partner)
+        mock_repository.get_active.return_value = conversation
+        mock_repository.append_message.side_effect = OSError("Database down")
+
+        with pytest.raises(OSError, match="Database down"):
+            async for _ in use_case.execute_stream(
+                SendMessageInput(
+                    conversation_id=conversation.id,
+                    content="User message",
+                )
+            ):
+                pass
+
     async def test_execute_stream_user_message_safe_on_empty_response(
         self,
         mock_repository: AsyncMock,
@@ -398,7 +573,7 @@ class TestSendMessage:
 
         use_case = SendMessage(repository=mock_repository, partner=mock_partner)
         mock_repository.get_active = AsyncMock(return_value=conversation)
-        mock_repository.save = AsyncMock(return_value=None)
+        mock_repository.append_message = AsyncMock(return_value=None)
 
         async for _ in use_case.execute_stream(
             SendMessageInput(
@@ -409,7 +584,7 @@ class TestSendMessage:
             pass
 
         # User message saved, no coach message (empty response)
-        assert mock_repository.save.call_count == 1
+        assert mock_repository.append_message.call_count == 1
         assert len(conversation.messages) == 1
         assert conversation.messages[0].content == "Test message"
 
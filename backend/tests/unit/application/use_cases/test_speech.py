@@ -110,3 +110,28 @@ class TestSpeechUseCases:
         use_case = SpeechUseCases(synthesizer=None)
         with pytest.raises(ValueError, match="synthesizer"):
             await use_case.synthesize(SynthesizeInput(text="Hello"))
+
+    async def test_synthesize_stream_yields_chunks(
+        self, use_case: SpeechUseCases, mock_synthesizer: MagicMock
+    ) -> None:
+        """Verify synthesize_stream relays audio chunks in order."""
+
+        async def fake_stream(text: str):
+            for chunk in (b"abc", b"def"):
+                yield chunk
+
+        mock_synthesizer.synthesize_stream = fake_stream
+
+        chunks = [
+            chunk
+            async for chunk in use_case.synthesize_stream(SynthesizeInput(text="Hi"))
+        ]
+
+        assert chunks == [b"abc", b"def"]
+
+    async def test_synthesize_stream_raises_if_not_configured(self) -> None:
+        """Verify streaming raises ValueError if synthesizer is missing."""
+        use_case = SpeechUseCases(synthesizer=None)
+        with pytest.raises(ValueError, match="synthesizer"):
+            async for _ in use_case.synthesize_stream(SynthesizeInput(text="Hello")):
+                pass
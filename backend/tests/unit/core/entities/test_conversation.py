@@ -13,6 +13,7 @@ from uuid import UUID, uuid4
 import time
 import pytest
 
+from src.core import clock
 from src.core.entities.conversation import Conversation, ConversationStatus
 from src.core.entities.conversation_summary import ConversationSummary
 from src.core.entities.message import Message, MessageRole
@@ -266,10 +267,10 @@ class TestConversationAddMessage:
 
 
 class TestConversationTimestampManagement:
-    """Tests for internal _touch() timestamp update across operations."""
+    """Tests for updated_at timestamp updates across operations."""
 
     def test_touch_updates_timestamp_on_archive(self, active_conversation):
-        """Archive should update timestamp via _touch()."""
+        """Archive should update the updated_at timestamp."""
         original = active_conversation.updated_at
         time.sleep(0.001)
 
@@ -278,7 +279,7 @@ class TestConversationTimestampManagement:
         assert active_conversation.updated_at > original
 
     def test_touch_updates_timestamp_on_restore(self, active_conversation):
-        """Restore should update timestamp via _touch()."""
+        """Restore should update the updated_at timestamp."""
         active_conversation.archive()
         original = active_conversation.updated_at
         time.sleep(0.001)
@@ -288,7 +289,7 @@ class TestConversationTimestampManagement:
         assert active_conversation.updated_at > original
 
     def test_touch_updates_timestamp_on_end(self, active_conversation):
-        """End should update timestamp via _touch()."""
+        """End should update the updated_at timestamp."""
         original = active_conversation.updated_at
         time.sleep(0.001)
 
@@ -297,7 +298,7 @@ class TestConversationTimestampManagement:
         assert active_conversation.updated_at > original
 
     def test_touch_updates_timestamp_on_add_message(self, active_conversation):
-        """Add message should update timestamp via _touch()."""
+        """Add message should update the updated_at timestamp."""
         original = active_conversation.updated_at
         time.sleep(0.001)
 
@@ -305,6 +306,25 @@ class TestConversationTimestampManagement:
 
         assert active_conversation.updated_at > original
 
+    def test_timestamps_use_domain_clock(self, monkeypatch):
+        """Create, defaults and add_message should all read the domain clock."""
+        fixed = datetime(2025, 1, 1, tzinfo=UTC)
+        monkeypatch.setattr(clock, "utc_now", lambda: fixed)
+
+        conv = Conversation.create(context_topic="Clock")
+        message = conv.add_message("Test", MessageRole.USER)
+
+        assert conv.created_at == fixed
+        assert conv.updated_at == fixed
+        assert message.created_at == fixed
+        assert Conversation(id=uuid4(), context_topic="Clock").created_at == fixed
+
+    def test_add_message_shares_timestamp_with_message(self, active_conversation):
+        """Add message should stamp the message and conversation identically."""
+        message = active_conversation.add_message("Test", MessageRole.USER)
+
+        assert message.created_at == active_conversation.updated_at
+
 
 class TestConversationAttachSummary:
     """Tests for Conversation.attach_summary() method."""
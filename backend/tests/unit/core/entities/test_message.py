@@ -4,8 +4,9 @@ Unit tests for Message entity.
 Tests for Message factory methods and entity behavior.
 """
 
+import json
 from datetime import UTC, datetime
-from uuid import UUID,uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -124,3 +125,30 @@ class TestMessageAttachFeedback:
             msg.attach_feedback(other_feedback)
 
 
+class TestMessageEnsureCanReceiveFeedback:
+    """Tests for Message.ensure_can_receive_feedback() method."""
+
+    def test_ensure_can_receive_feedback_accepts_fresh_user_message(self):
+        """Should not raise for a user message without feedback."""
+        msg = Message.create(content="Hello", role=MessageRole.USER)
+
+        msg.ensure_can_receive_feedback()
+
+        assert msg.feedback is None
+
+    def test_ensure_can_receive_feedback_rejects_coach_message(self):
+        """Should raise for a coach message, checked by role identity."""
+        msg = Message.create(content="Hi there!", role=MessageRole.COACH)
+
+        with pytest.raises(InvalidMessageContentError, match="Only user messages"):
+            msg.ensure_can_receive_feedback()
+
+
+class TestMessageRole:
+    """Tests for MessageRole string behaviour."""
+
+    def test_role_is_its_string_value(self):
+        """Roles should compare and serialize as their plain string values."""
+        assert MessageRole.USER == "user"
+        assert str(MessageRole.COACH) == "coach"
+        assert json.dumps(MessageRole.USER) == '"user"'
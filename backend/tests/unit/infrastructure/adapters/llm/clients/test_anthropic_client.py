@@ -0,0 +1,190 @@
+"""Tests for Anthropic LLM Client."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from anthropic import APIConnectionError, APITimeoutError
+
+from src.core.exceptions import PartnerConnectionError, PartnerResponseError
+from src.infrastructure.adapters.llm.clients.anthropic_client import AnthropicClient
+from src.infrastructure.adapters.llm.clients.base import LLMMessage
+
+
+@pytest.fixture
+def mock_anthropic_async_client():
+    """Mock AsyncAnthropic client."""
+    mock_client = MagicMock()
+    mock_client.messages = MagicMock()
+    mock_client.messages.create = AsyncMock()
+    return mock_client
+
+
+@pytest.fixture
+def anthropic_client(mock_anthropic_async_client):
+    """Anthropic client with mocked underlying client."""
+    client = AnthropicClient.__new__(AnthropicClient)
+    client.model = "claude-3-haiku-20240307"
+    client._client = mock_anthropic_async_client
+    return client
+
+
+@pytest.fixture
+def sample_messages():
+    """Sample LLM messages with a leading system prompt."""
+    return [
+        LLMMessage(role="system", content="You are a helpful assistant."),
+        LLMMessage(role="user", content="Hello!"),
+        LLMMessage(role="assistant", content="Hi!"),
+    ]
+
+
+class TestAnthropicClientComplete:
+    """Tests for AnthropicClient.complete method."""
+
+    @pytest.mark.asyncio
+    async def test_complete_success(
+        self, anthropic_client, mock_anthropic_async_client, sample_messages
+    ):
+        """Successful completion returns LLMResponse."""
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="Hello there!")]
+        mock_anthropic_async_client.messages.create.return_value = mock_response
+
+        response = await anthropic_client.complete(sample_messages)
+
+        assert response.content == "Hello there!"
+        assert response.model == "claude-3-haiku-20240307"
+
+    @pytest.mark.asyncio
+    async def test_complete_moves_system_prompt_out_of_messages(
+        self, anthropic_client, mock_anthropic_async_client, sample_messages
+    ):
+        """Leading system message is sent as the system parameter."""
+        mock_anthropic_async_client.messages.create.return_value = MagicMock(
+            content=[MagicMock(text="ok")]
+        )
+
+        await anthropic_client.complete(sample_messages)
+
+        call_kwargs = mock_anthropic_async_client.messages.create.call_args[1]
+        assert call_kwargs["system"] == "You are a helpful assistant."
+        assert call_kwargs["messages"] == [
+            {"role": "user", "content": "Hello!"},
+            {"role": "assistant", "content": "Hi!"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_complete_without_system_prompt(
+        self, anthropic_client, mock_anthropic_async_client
+    ):
+        """Messages without a system prompt are sent unchanged."""
+        mock_anthropic_async_client.messages.create.return_value = MagicMock(
+            content=[MagicMock(text="ok")]
+        )
+
+        await anthropic_client.complete([LLMMessage(role="user", content="Hello!")])
+
+        call_kwargs = mock_anthropic_async_client.messages.create.call_args[1]
+        assert "system" not in call_kwargs
+        assert call_kwargs["messages"] == [{"role": "user", "content": "Hello!"}]
+
+    @pytest.mark.asyncio
+    async def test_complete_extracts_non_leading_system_prompt(
+        self, anthropic_client, mock_anthropic_async_client
+    ):
+        """A system message after other turns is still moved out of messages."""
+        mock_anthropic_async_client.messages.create.return_value = MagicMock(
+            content=[MagicMock(text="ok")]
+        )
+
+        await anthropic_client.complete(
+            [
+                LLMMessage(role="user", content="Hello!"),
+                LLMMessage(role="system", content="Be brief."),
+                LLMMessage(role="assistant", content="Hi!"),
+            ]
+        )
+
+        call_kwargs = mock_anthropic_async_client.messages.create.call_args[1]
+        assert call_kwargs["system"] == "Be brief."
+        assert call_kwargs["messages"] == [
+            {"role": "user", "content": "Hello!"},
+            {"role": "assistant", "content": "Hi!"},
+        ]
+
+
+class TestAnthropicClientErrors:
+    """Tests for AnthropicClient error classification."""
+
+    @pytest.mark.asyncio
+    async def test_connection_error(
+        self, anthropic_client, mock_anthropic_async_client, sample_messages
+    ):
+        """SDK connection errors raise PartnerConnectionError."""
+        mock_anthropic_async_client.messages.create.side_effect = APIConnectionError(
+            request=httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        )
+
+        with pytest.raises(PartnerConnectionError, match="Cannot connect"):
+            await anthropic_client.complete(sample_messages)
+
+    @pytest.mark.asyncio
+    async def test_timeout_error(
+        self, anthropic_client, mock_anthropic_async_client, sample_messages
+    ):
+        """SDK timeouts raise PartnerConnectionError."""
+        mock_anthropic_async_client.messages.create.side_effect = APITimeoutError(
+            request=httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        )
+
+        with pytest.raises(PartnerConnectionError):
+            await anthropic_client.complete(sample_messages)
+
+    @pytest.mark.asyncio
+    async def test_message_mentioning_timeout_is_response_error(
+        self, anthropic_client, mock_anthropic_async_client, sample_messages
+    ):
+        """Non-connection errors stay PartnerResponseError whatever their text."""
+        mock_anthropic_async_client.messages.create.side_effect = Exception(
+            "504 gateway timeout"
+        )
+
+        with pytest.raises(PartnerResponseError, match="Anthropic API error"):
+            await anthropic_client.complete(sample_messages)
+
+
+class TestAnthropicClientJsonMode:
+    """Tests for AnthropicClient JSON mode."""
+
+    @pytest.mark.asyncio
+    async def test_json_mode_appends_instruction(
+        self, anthropic_client, mock_anthropic_async_client, sample_messages
+    ):
+        """JSON mode appends the JSON-only instruction to the system prompt."""
+        mock_anthropic_async_client.messages.create.return_value = MagicMock(
+            content=[MagicMock(text="{}")]
+        )
+
+        await anthropic_client.complete(sample_messages, json_mode=True)
+
+        call_kwargs = mock_anthropic_async_client.messages.create.call_args[1]
+        assert call_kwargs["system"] == (
+            "You are a helpful assistant.\n\nIMPORTANT: Respond with valid JSON only."
+        )
+
+    @pytest.mark.asyncio
+    async def test_json_mode_without_system_prompt(
+        self, anthropic_client, mock_anthropic_async_client
+    ):
+        """JSON mode without a system prompt sends the bare instruction."""
+        mock_anthropic_async_client.messages.create.return_value = MagicMock(
+            content=[MagicMock(text="{}")]
+        )
+
+        await anthropic_client.complete(
+            [LLMMessage(role="user", content="Hello!")], json_mode=True
+        )
+
+        call_kwargs = mock_anthropic_async_client.messages.create.call_args[1]
+        assert call_kwargs["system"] == "Respond with valid JSON only."
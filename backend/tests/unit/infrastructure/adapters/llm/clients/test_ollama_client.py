@@ -0,0 +1,213 @@
+"""Tests for Ollama LLM Client."""
+
+import asyncio
+import gc
+import json
+
+import httpx
+import pytest
+
+from src.core.exceptions import PartnerConnectionError, PartnerResponseError
+from src.infrastructure.adapters.llm.clients.base import LLMMessage
+from src.infrastructure.adapters.llm.clients.ollama_client import OllamaClient
+
+
+def make_client(handler) -> OllamaClient:
+    """Ollama client backed by an in-memory transport."""
+    return OllamaClient(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+
+@pytest.fixture
+def sample_messages():
+    """Sample LLM messages."""
+    return [
+        LLMMessage(role="system", content="You are a helpful assistant."),
+        LLMMessage(role="user", content="Hello!"),
+    ]
+
+
+class TestOllamaClientComplete:
+    """Tests for OllamaClient.complete method."""
+
+    @pytest.mark.asyncio
+    async def test_complete_success(self, sample_messages):
+        """Successful completion returns LLMResponse."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.content)
+            assert payload["stream"] is False
+            assert str(request.url) == "http://localhost:11434/api/chat"
+            return httpx.Response(
+                200, json={"message": {"role": "assistant", "content": "Hi!"}}
+            )
+
+        response = await make_client(handler).complete(sample_messages)
+
+        assert response.content == "Hi!"
+        assert response.model == "llama3.2"
+
+    @pytest.mark.asyncio
+    async def test_complete_error_status(self, sample_messages):
+        """HTTP error statuses raise PartnerResponseError."""
+        client = make_client(lambda request: httpx.Response(500, text="boom"))
+
+        with pytest.raises(PartnerResponseError, match="500"):
+            await client.complete(sample_messages)
+
+    @pytest.mark.asyncio
+    async def test_complete_connection_error(self, sample_messages):
+        """Connection failures raise PartnerConnectionError."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        with pytest.raises(PartnerConnectionError, match="Is Ollama running"):
+            await make_client(handler).complete(sample_messages)
+
+
+class TestOllamaClientSharedClient:
+    """Tests for OllamaClient HTTP client reuse."""
+
+    @pytest.mark.asyncio
+    async def test_instances_share_pooled_client(self):
+        """Clients without an injected client reuse one pooled client."""
+        try:
+            first = OllamaClient()._get_client()
+            second = OllamaClient(model="mistral")._get_client()
+
+            assert first is second
+        finally:
+            await OllamaClient.aclose_shared()
+
+    @pytest.mark.asyncio
+    async def test_aclose_shared_closes_client(self):
+        """aclose_shared() closes the pooled client and a new one is created."""
+        client = OllamaClient()._get_client()
+
+        await OllamaClient.aclose_shared()
+
+        assert client.is_closed
+        try:
+            assert OllamaClient()._get_client() is not client
+        finally:
+            await OllamaClient.aclose_shared()
+
+    @pytest.mark.asyncio
+    async def test_injected_client_is_used(self):
+        """An injected client takes precedence over the shared one."""
+        injected = httpx.AsyncClient()
+        try:
+            assert OllamaClient(client=injected)._get_client() is injected
+        finally:
+            await injected.aclose()
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_shared_client(self):
+        """Leaving the async context closes the pooled client."""
+        async with OllamaClient() as ollama:
+            client = ollama._get_client()
+
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_aclose_leaves_injected_client_open(self):
+        """aclose() does not close a client owned by the caller."""
+        injected = httpx.AsyncClient()
+        try:
+            await OllamaClient(client=injected).aclose()
+
+            assert not injected.is_closed
+        finally:
+            await injected.aclose()
+
+    def test_shared_client_dropped_with_its_loop(self):
+        """A finished event loop does not keep its pooled client cached."""
+        before = len(OllamaClient._shared_clients)
+
+        async def use_client():
+            OllamaClient()._get_client()
+            assert len(OllamaClient._shared_clients) == before + 1
+
+        asyncio.run(use_client())
+        gc.collect()
+
+        assert len(OllamaClient._shared_clients) == before
+
+
+class TestOllamaClientCompleteStream:
+    """Tests for OllamaClient.complete_stream method."""
+
+    @pytest.mark.asyncio
+    async def test_stream_reassembles_lines_split_across_chunks(self, sample_messages):
+        """NDJSON frames split across network chunks are decoded whole."""
+
+        async def body():
+            yield b'{"message":{"content":"He'
+            yield b'llo"}}\n\n{"message":{"content":" wo'
+            yield b'rld"}}\nnot json\n{"message":{"content":""},"done":true}\n'
+            yield b'{"message":{"content":"ignored"}}\n'
+
+        client = make_client(lambda request: httpx.Response(200, content=body()))
+
+        tokens = [token async for token in client.complete_stream(sample_messages)]
+
+        assert tokens == ["Hello", " world"]
+
+    @pytest.mark.asyncio
+    async def test_stream_reads_final_line_without_newline(self, sample_messages):
+        """A last frame without a trailing newline is still decoded."""
+
+        async def body():
+            yield b'{"message":{"content":"Hi"}}\n{"message":{"content":"!"}}'
+
+        client = make_client(lambda request: httpx.Response(200, content=body()))
+
+        tokens = [token async for token in client.complete_stream(sample_messages)]
+
+        assert tokens == ["Hi", "!"]
+
+    @pytest.mark.asyncio
+    async def test_stream_recovers_objects_glued_on_one_line(self, sample_messages):
+        """Objects concatenated without a newline are all decoded."""
+
+        async def body():
+            yield b'{"message":{"content":"a"}}{"message":{"content":"b"}}\n'
+            yield b'{"message":{"content":"c"}} garbage\n'
+
+        client = make_client(lambda request: httpx.Response(200, content=body()))
+
+        tokens = [token async for token in client.complete_stream(sample_messages)]
+
+        assert tokens == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_stream_skips_invalid_utf8_frames(self, sample_messages):
+        """Frames that are not valid UTF-8 are skipped, not raised."""
+
+        async def body():
+            yield b"\x80abc\n"
+            yield b'{"message":{"content":"ok"}}\n'
+            yield b'\xff{"message":{"content":"corrupt"}}\n'
+            yield b'{"message":{"content":"!"}}\n'
+
+        client = make_client(lambda request: httpx.Response(200, content=body()))
+
+        tokens = [token async for token in client.complete_stream(sample_messages)]
+
+        assert tokens == ["ok", "!"]
+
+    @pytest.mark.asyncio
+    async def test_stream_ignores_non_object_frames(self, sample_messages):
+        """JSON values that are not objects are skipped."""
+
+        async def body():
+            yield b'[1, 2]\n"text"\n42\nnull\n'
+            yield b'{"message":{"content":"ok"}}\n'
+
+        client = make_client(lambda request: httpx.Response(200, content=body()))
+
+        tokens = [token async for token in client.complete_stream(sample_messages)]
+
+        assert tokens == ["ok"]
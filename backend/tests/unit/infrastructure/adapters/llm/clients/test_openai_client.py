@@ -2,7 +2,9 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from openai import APIConnectionError, APITimeoutError
 
 from src.core.exceptions import PartnerConnectionError, PartnerResponseError
 from src.infrastructure.adapters.llm.clients.base import LLMMessage
@@ -70,7 +72,9 @@ class TestOpenAIClientComplete:
     @pytest.mark.asyncio
     async def test_complete_connection_error(self, openai_client, mock_openai_async_client, sample_messages):
         """Connection errors raise PartnerConnectionError."""
-        mock_openai_async_client.chat.completions.create.side_effect = Exception("connection failed")
+        mock_openai_async_client.chat.completions.create.side_effect = APIConnectionError(
+            request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        )
 
         with pytest.raises(PartnerConnectionError, match="Cannot connect"):
             await openai_client.complete(sample_messages)
@@ -78,7 +82,9 @@ class TestOpenAIClientComplete:
     @pytest.mark.asyncio
     async def test_complete_timeout_error(self, openai_client, mock_openai_async_client, sample_messages):
         """Timeout errors raise PartnerConnectionError."""
-        mock_openai_async_client.chat.completions.create.side_effect = Exception("timeout occurred")
+        mock_openai_async_client.chat.completions.create.side_effect = APITimeoutError(
+            request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        )
 
         with pytest.raises(PartnerConnectionError, match="Cannot connect"):
             await openai_client.complete(sample_messages)
@@ -86,7 +92,8 @@ class TestOpenAIClientComplete:
     @pytest.mark.asyncio
     async def test_complete_generic_error(self, openai_client, mock_openai_async_client, sample_messages):
         """Generic errors raise PartnerResponseError."""
-        mock_openai_async_client.chat.completions.create.side_effect = Exception("API error")
+        # Message text no longer drives the mapping: only the exception type does
+        mock_openai_async_client.chat.completions.create.side_effect = Exception("connection timeout")
 
         with pytest.raises(PartnerResponseError, match="OpenAI API error"):
             await openai_client.complete(sample_messages)
@@ -136,7 +143,9 @@ class TestOpenAIClientCompleteStream:
     @pytest.mark.asyncio
     async def test_complete_stream_connection_error(self, openai_client, mock_openai_async_client, sample_messages):
         """Connection errors during streaming raise PartnerConnectionError."""
-        mock_openai_async_client.chat.completions.create.side_effect = Exception("connection failed")
+        mock_openai_async_client.chat.completions.create.side_effect = APIConnectionError(
+            request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        )
 
         with pytest.raises(PartnerConnectionError, match="Cannot connect"):
             async for _ in openai_client.complete_stream(sample_messages):
@@ -107,3 +107,103 @@ class TestLLMFeedbackAnalyzer:
         # Only the last valid correction should remain
         assert len(feedback.corrections) == 1
         assert feedback.corrections[0].correction_type == CorrectionType.VOCABULARY
+
+    @pytest.mark.asyncio
+    async def test_analyze_message_normalizes_type_case_and_whitespace(
+        self, mock_client, sample_message
+    ):
+        """Correction types are matched case-insensitively, ignoring whitespace."""
+        mock_client.complete.return_value = LLMResponse(
+            content='''{
+                "corrections": [
+                    {"original": "go", "corrected": "went", "type": " Grammar "},
+                    {"original": "at", "corrected": "to", "type": "PHRASING"}
+                ],
+                "suggestions": []
+            }'''
+        )
+
+        analyzer = LLMFeedbackAnalyzer(mock_client)
+        feedback = await analyzer.analyze_message(sample_message)
+
+        assert [c.correction_type for c in feedback.corrections] == [
+            CorrectionType.GRAMMAR,
+            CorrectionType.PHRASING,
+        ]
+
+
+class TestLLMFeedbackAnalyzerBatch:
+    """Tests for LLMFeedbackAnalyzer.analyze_messages."""
+
+    @pytest.fixture
+    def batch_messages(self):
+        """Two user messages analyzed together."""
+        return [
+            Message.reconstitute(
+                id=uuid4(),
+                content=content,
+                role=MessageRole.USER,
+                created_at=datetime.now(UTC),
+            )
+            for content in ("She go to school", "I like apples")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_analyze_messages_single_call(self, mock_client, batch_messages):
+        """All messages are analyzed in one LLM call, results in order."""
+        mock_client.complete.return_value = LLMResponse(
+            content="""{
+                "results": [
+                    {"corrections": [{"original": "go", "corrected": "goes", "type": "grammar"}], "suggestions": []},
+                    {"corrections": [], "suggestions": ["Try longer sentences"]}
+                ]
+            }"""
+        )
+
+        analyzer = LLMFeedbackAnalyzer(mock_client)
+        feedbacks = await analyzer.analyze_messages(batch_messages)
+
+        mock_client.complete.assert_awaited_once()
+        prompt = mock_client.complete.call_args.args[0][1].content
+        assert 'Message 1: "She go to school"' in prompt
+        assert 'Message 2: "I like apples"' in prompt
+        assert [len(f.corrections) for f in feedbacks] == [1, 0]
+        assert feedbacks[1].suggestions == ["Try longer sentences"]
+
+    @pytest.mark.asyncio
+    async def test_analyze_messages_result_count_mismatch(
+        self, mock_client, batch_messages
+    ):
+        """A response without one result per message raises."""
+        mock_client.complete.return_value = LLMResponse(
+            content='{"results": [{"corrections": [], "suggestions": []}]}'
+        )
+
+        analyzer = LLMFeedbackAnalyzer(mock_client)
+
+        with pytest.raises(FeedbackAnalysisError, match="Expected 2 results"):
+            await analyzer.analyze_messages(batch_messages)
+
+    @pytest.mark.asyncio
+    async def test_analyze_messages_single_uses_message_prompt(
+        self, mock_client, sample_message
+    ):
+        """A one-message batch uses the regular per-message prompt."""
+        mock_client.complete.return_value = LLMResponse(
+            content='{"corrections": [], "suggestions": []}'
+        )
+
+        analyzer = LLMFeedbackAnalyzer(mock_client)
+        feedbacks = await analyzer.analyze_messages([sample_message])
+
+        assert len(feedbacks) == 1
+        prompt = mock_client.complete.call_args.args[0][1].content
+        assert f'Message: "{sample_message.content}"' in prompt
+
+    @pytest.mark.asyncio
+    async def test_analyze_messages_empty(self, mock_client):
+        """An empty batch makes no LLM call."""
+        analyzer = LLMFeedbackAnalyzer(mock_client)
+
+        assert await analyzer.analyze_messages([]) == []
+        mock_client.complete.assert_not_called()
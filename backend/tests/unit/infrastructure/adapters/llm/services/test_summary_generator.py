@@ -81,3 +81,17 @@ class TestLLMSummaryGenerator:
 
         with pytest.raises(SummaryGenerationError, match="Summary generation failed"):
             await generator.create_summary(sample_conversation)
+
+    @pytest.mark.asyncio
+    async def test_create_summary_prompt_lists_user_messages(
+        self, mock_client, sample_conversation
+    ):
+        """Only user messages are sent, as a bullet list in order."""
+        mock_client.complete.return_value = LLMResponse(content="{}")
+
+        generator = LLMSummaryGenerator(mock_client)
+        await generator.create_summary(sample_conversation)
+
+        prompt = mock_client.complete.call_args.args[0][1].content
+        assert "User Messages:\n- I want coffee\n- A latte please\n" in prompt
+        assert "What kind?" not in prompt
@@ -1,10 +1,11 @@
 """Tests for Provider Registry."""
 
+import sys
 from unittest.mock import MagicMock
 
 import pytest
 
-from src.infrastructure.adapters.llm.models import ModelInfo
+from src.infrastructure.adapters.llm.models import ModelCapability, ModelInfo
 from src.infrastructure.adapters.llm.registry import (
     ProviderRegistry,
     register_provider,
@@ -133,27 +134,51 @@ class TestLazyLoading:
 
     def test_ensure_loaded_handles_import_errors(self, registry, monkeypatch):
         """_ensure_loaded handles ImportError and other exceptions."""
-        original_import = __import__
+        imported = []
 
-        def fake_import(name, *args, **kwargs):
-            if name == "src.infrastructure.adapters.llm.providers.anthropic":
+        def fake_import_module(name):
+            imported.append(name.rsplit(".", 1)[-1])
+            if name.endswith(".anthropic"):
                 raise ImportError("missing")
-            if name == "src.infrastructure.adapters.llm.providers.openai":
+            if name.endswith(".openai"):
                 raise Exception("boom")
-            if name == "src.infrastructure.adapters.llm.providers.ollama":
-                return MagicMock()
-            return original_import(name, *args, **kwargs)
+            return MagicMock()
 
-        monkeypatch.setattr("builtins.__import__", fake_import)
+        # The package re-exports a `registry` instance that shadows the module
+        registry_module = sys.modules[ProviderRegistry.__module__]
+        monkeypatch.setattr(registry_module, "import_module", fake_import_module)
 
         registry._loaded = False
         registry._ensure_loaded()
 
         assert registry._loaded
+        assert imported == ["anthropic", "ollama", "openai"]
 
         # Second load should be idempotent
         registry._ensure_loaded()
         assert registry._loaded
+        assert len(imported) == 3
+
+    def test_ensure_loaded_skips_providers_with_missing_sdk(
+        self, registry, monkeypatch
+    ):
+        """Provider modules are not imported when their SDK is absent."""
+        imported = []
+        registry_module = sys.modules[ProviderRegistry.__module__]
+        monkeypatch.setattr(
+            registry_module,
+            "find_spec",
+            lambda name: None if name == "openai" else MagicMock(),
+        )
+        monkeypatch.setattr(
+            registry_module,
+            "import_module",
+            lambda name: imported.append(name.rsplit(".", 1)[-1]),
+        )
+
+        registry._ensure_loaded()
+
+        assert imported == ["anthropic", "ollama"]
 
 
 class TestGetAvailableModels:
@@ -206,6 +231,89 @@ class TestGetAvailableModels:
         ids = [m.id for m in models]
         assert "mock/m1" in ids and "other/m" in ids
 
+    def test_filters_by_capability(self, registry):
+        """Only models with the requested capability flag are returned."""
+
+        @registry.register
+        class Mixed:
+            provider_id = "mixed"
+
+            @staticmethod
+            def is_available(settings):
+                return True
+
+            @staticmethod
+            def list_models():
+                return [
+                    ModelInfo(id="mixed/default", name="D", provider="mixed"),
+                    ModelInfo(
+                        id="mixed/json",
+                        name="J",
+                        provider="mixed",
+                        capabilities=ModelCapability.CHAT | ModelCapability.JSON_MODE,
+                    ),
+                ]
+
+        settings = MagicMock()
+
+        json_models = registry.get_available_models(
+            settings, capability=ModelCapability.JSON_MODE
+        )
+        summary_models = registry.get_available_models(
+            settings, capability=ModelCapability.SUMMARY
+        )
+
+        assert [m.id for m in json_models] == ["mixed/json"]
+        assert [m.id for m in summary_models] == ["mixed/default"]
+
+    def test_list_models_called_once(self, registry):
+        """Provider model lists are cached across calls and filters."""
+        calls = []
+
+        @registry.register
+        class Counting:
+            provider_id = "counting"
+
+            @staticmethod
+            def is_available(settings):
+                return True
+
+            @staticmethod
+            def list_models():
+                calls.append(1)
+                return [ModelInfo(id="counting/m", name="M", provider="counting")]
+
+        settings = MagicMock()
+
+        first = registry.get_available_models(settings)
+        second = registry.get_available_models(settings)
+        registry.get_available_models(settings, capability=ModelCapability.CHAT)
+        registry.get_available_models(settings, capability=ModelCapability.CHAT)
+
+        assert first == second
+        assert first is not second
+        assert len(calls) == 2  # once unfiltered, once for CHAT
+
+    def test_register_invalidates_model_cache(self, registry, mock_provider):
+        """Registering a provider refreshes cached model lists."""
+        registry.register(mock_provider)
+        settings = MagicMock(api_key="key")
+        assert len(registry.get_available_models(settings)) == 1
+
+        @registry.register
+        class Late:
+            provider_id = "late"
+
+            @staticmethod
+            def is_available(settings):
+                return True
+
+            @staticmethod
+            def list_models():
+                return [ModelInfo(id="late/m", name="M", provider="late")]
+
+        assert len(registry.get_available_models(settings)) == 2
+
 
 class TestCreateClient:
     """Test creating clients."""